@@ -5,17 +5,22 @@ This script provides a command-line interface for parsing, validating,
 and standardizing geophysical data from various formats.
 """
 
+import os
 import sys
+import stat
 import argparse
 import logging
+import logging.handlers
+import multiprocessing
 from pathlib import Path
-from typing import Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.core.dispatcher import Dispatcher
-from src.processors.standardizer import Standardizer
-from src.processors.qc_checker import QCChecker
-from src.utils.logger import setup_logger
+# Only lightweight modules are imported at startup so that --help and
+# --version return without loading pandas; the processing modules are
+# imported inside the functions that use them.
 from src.config import setup_logging, get_output_path, APP_CONFIG
+from src.utils.logger import get_handlers
 
 
 def parse_arguments():
@@ -32,28 +37,48 @@ Examples:
   %(prog)s --input data.csv --type electrical --output result.csv
   %(prog)s --input survey.sgy --type seismic --format json
   %(prog)s --input gpr.dzt --type radar --skip-qc --verbose
+  %(prog)s --input-dir surveys/ --output results/ --jobs 8
         """
     )
     
-    parser.add_argument(
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    
+    input_group.add_argument(
         '--input', '-i',
         type=str,
-        required=True,
         help='Path to input data file'
     )
     
+    input_group.add_argument(
+        '--input-dir',
+        type=str,
+        help='Process every supported file in this directory in parallel'
+    )
+    
     parser.add_argument(
         '--type', '-t',
         type=str,
         choices=['electrical', 'seismic', 'radar'],
-        required=True,
-        help='Type of geophysical data'
+        help=(
+            'Type of geophysical data (required with --input; with '
+            '--input-dir it is detected per file from the extension if omitted)'
+        )
     )
     
     parser.add_argument(
         '--output', '-o',
         type=str,
-        help='Path to output file (optional, auto-generated if not provided)'
+        help=(
+            'Path to output file, or output directory with --input-dir '
+            '(optional, auto-generated if not provided)'
+        )
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Number of worker processes for --input-dir (default: CPU count)'
     )
     
     parser.add_argument(
@@ -70,6 +95,15 @@ Examples:
         help='Output file format (default: csv)'
     )
     
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help=(
+            f"Process the input in chunks of {APP_CONFIG['chunk_size']} rows "
+            "to bound memory use (csv/parquet output only; skips QC)"
+        )
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -82,7 +116,14 @@ Examples:
         version=f"%(prog)s {APP_CONFIG['version']}"
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    
+    if args.input and not args.type:
+        parser.error('--type is required with --input')
+    if args.input_dir and args.stream:
+        parser.error('--stream is not supported with --input-dir')
+    
+    return args
 
 
 def validate_input_file(file_path: Path) -> None:
@@ -94,19 +135,299 @@ def validate_input_file(file_path: Path) -> None:
     Raises:
         SystemExit: If validation fails.
     """
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
         print(f"Error: Input file not found: {file_path}", file=sys.stderr)
         sys.exit(1)
     
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         print(f"Error: Input path is not a file: {file_path}", file=sys.stderr)
         sys.exit(1)
     
-    if file_path.stat().st_size == 0:
+    if st.st_size == 0:
         print(f"Error: Input file is empty: {file_path}", file=sys.stderr)
         sys.exit(1)
 
 
+def run_streaming(args, input_path: Path, output_path: Path) -> int:
+    """Run the parse/validate/standardize/write pipeline chunk by chunk.
+    
+    Each chunk flows through validation, standardization and output before
+    the next one is read, so no full-size DataFrame is ever materialized.
+    Whole-dataset QC checks (duplicates, outliers) are not run in this mode.
+    
+    Args:
+        args: Parsed command-line arguments.
+        input_path: Path to the input file.
+        output_path: Path to the output file.
+    
+    Returns:
+        Exit code (0 for success).
+    """
+    from src.core.dispatcher import Dispatcher
+    from src.processors.standardizer import Standardizer
+    
+    logger = logging.getLogger(__name__)
+    logger.info("Streaming %s data in chunks of %d rows", args.type, APP_CONFIG['chunk_size'])
+    
+    dispatcher = Dispatcher()
+    parser = dispatcher.get_parser(args.type, input_path)
+    standardizer = Standardizer(output_format=args.format)
+    
+    def validated_chunks():
+        for chunk in parser.parse_iter():
+            parser.validate(chunk)
+            yield chunk
+    
+    record_count = standardizer.write_stream(
+        validated_chunks(), args.type, output_path,
+        metadata=parser.metadata, column_dtypes=parser.column_dtypes
+    )
+    logger.info("✓ Streamed %d records to %s", record_count, output_path)
+    
+    print("\n" + "=" * 60)
+    print("SUCCESS: Data processing complete (streaming)")
+    print("=" * 60)
+    print(f"Input file:      {input_path}")
+    print(f"Data type:       {args.type}")
+    print(f"Records written: {record_count}")
+    print(f"Output file:     {output_path}")
+    print(f"Output format:   {args.format}")
+    print("=" * 60 + "\n")
+    
+    return 0
+
+
+def run_pipeline(
+    input_path: Path,
+    data_type: str,
+    output_path: Path,
+    output_format: str = 'csv',
+    skip_qc: bool = False
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Parse, check, validate, standardize and write a single input file.
+    
+    Args:
+        input_path: Path to the input file.
+        data_type: Type of geophysical data.
+        output_path: Path to the output file.
+        output_format: Output file format.
+        skip_qc: If True, skip quality control checks.
+    
+    Returns:
+        Tuple of (parsed data, QC result or None if QC was skipped).
+    
+    Raises:
+        ParserError: If parsing or validation fails.
+    """
+    from src.core.base_parser import ValidationError
+    from src.core.dispatcher import Dispatcher
+    from src.processors.standardizer import Standardizer
+    from src.processors.qc_checker import QCChecker
+    
+    logger = logging.getLogger(__name__)
+    
+    # Step 1: Parse data
+    logger.info("Step 1/4: Parsing data...")
+    dispatcher = Dispatcher()
+    parser = dispatcher.get_parser(data_type, input_path)
+    parsed_data = parser.process(skip_validation=True)
+    logger.info("✓ Parsed %d records", parsed_data['metadata']['record_count'])
+    
+    # Step 2: Quality control (optional)
+    qc_result = None
+    if not skip_qc:
+        logger.info("Step 2/4: Running quality control checks...")
+        qc_checker = QCChecker()
+        qc_result = qc_checker.check(parsed_data, data_type)
+        
+        if qc_result['passed']:
+            logger.info("✓ QC checks passed")
+        else:
+            logger.warning("⚠ QC checks found issues:")
+            for issue in qc_result['issues']:
+                logger.warning("  - %s", issue)
+        
+        if qc_result.get('warnings'):
+            logger.info("QC warnings:")
+            for warning in qc_result['warnings']:
+                logger.info("  - %s", warning)
+    else:
+        logger.info("Step 2/4: Skipping quality control checks")
+    
+    # Step 3: Validate data
+    logger.info("Step 3/4: Validating data...")
+    if qc_result is not None and qc_result['schema_valid'] is not None:
+        # QC already ran the schema and range checks in the same pass
+        if not qc_result['schema_valid']:
+            raise ValidationError("; ".join(qc_result['schema_errors']))
+    else:
+        parser.validate()
+    logger.info("✓ Validation passed")
+    
+    # Step 4: Standardize and output
+    logger.info("Step 4/4: Standardizing and writing output...")
+    standardizer = Standardizer(output_format=output_format)
+    standardized_data = standardizer.standardize(parsed_data, data_type)
+    standardizer.write_output(standardized_data, output_path)
+    logger.info("✓ Output written to %s", output_path)
+    
+    return parsed_data, qc_result
+
+
+def _init_worker(log_queue, level: int) -> None:
+    """Send a worker process's log records to the parent's queue.
+    
+    Args:
+        log_queue: Multiprocessing queue drained by the parent process.
+        level: Lowest level any of the parent's handlers writes; records
+            below it are dropped in the worker instead of being pickled.
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(level)
+
+
+def _process_one(task: Tuple[str, Optional[str], str, str, bool]) -> Tuple[str, int, Optional[str]]:
+    """Run the pipeline for one file of a batch in a worker process.
+    
+    Args:
+        task: Tuple of (input path, data type or None to detect it from the
+            extension, output path, output format, skip QC).
+    
+    Returns:
+        Tuple of (input path, records parsed, error message or None).
+    """
+    input_file, data_type, output_file, output_format, skip_qc = task
+    input_path = Path(input_file)
+    output_path = Path(output_file)
+    
+    try:
+        if data_type is None:
+            from src.core.dispatcher import Dispatcher
+            data_type = Dispatcher().detect_type(input_path)
+        
+        parsed_data, _ = run_pipeline(
+            input_path, data_type, output_path, output_format, skip_qc
+        )
+        return input_file, parsed_data['metadata']['record_count'], None
+    except Exception as e:
+        logging.getLogger(__name__).error("Failed to process %s: %s", input_path.name, e)
+        return input_file, 0, str(e)
+
+
+def _batch_output_paths(files: List[str], args) -> Dict[str, Path]:
+    """Choose an output path for every file of a batch.
+    
+    Inputs that share a stem (e.g. ``x.csv`` and ``x.dat``) would map to the
+    same output file, so those keep their source extension in the name
+    (``x_csv_standardized.csv``).
+    
+    Args:
+        files: Input file paths.
+        args: Parsed command-line arguments.
+    
+    Returns:
+        Dictionary mapping each input path to its output path.
+    """
+    output_dir = Path(args.output) if args.output else None
+    stems = Counter(Path(path).stem for path in files)
+    
+    output_paths = {}
+    for path in files:
+        input_path = Path(path)
+        suffix = '_standardized'
+        if stems[input_path.stem] > 1:
+            suffix = f"_{input_path.suffix.lstrip('.')}{suffix}"
+        output_paths[path] = get_output_path(
+            input_path, output_dir=output_dir, format=args.format, suffix=suffix
+        )
+    return output_paths
+
+
+def run_batch(args) -> int:
+    """Process every supported file in a directory with a process pool.
+    
+    Worker processes forward their log records through a multiprocessing
+    queue to the parent, which writes them with its own handlers.
+    
+    Args:
+        args: Parsed command-line arguments.
+    
+    Returns:
+        Exit code (0 if every file succeeded, 1 otherwise).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from src.config import PARSER_CONFIG
+    
+    logger = logging.getLogger(__name__)
+    
+    input_dir = Path(args.input_dir)
+    if not input_dir.is_dir():
+        print(f"Error: Input path is not a directory: {input_dir}", file=sys.stderr)
+        return 1
+    
+    extensions = {
+        ext for cfg in PARSER_CONFIG.values() for ext in cfg['supported_extensions']
+    }
+    files = sorted(
+        str(path) for path in input_dir.iterdir()
+        if path.suffix.lower() in extensions and path.is_file()
+    )
+    if not files:
+        print(f"Error: No supported files found in {input_dir}", file=sys.stderr)
+        return 1
+    
+    jobs = args.jobs or getattr(os, 'process_cpu_count', os.cpu_count)() or 1
+    logger.info("Processing %d files from %s with %d workers", len(files), input_dir, jobs)
+    
+    tasks = [
+        (path, args.type, str(output_path), args.format, args.skip_qc)
+        for path, output_path in _batch_output_paths(files, args).items()
+    ]
+    
+    # Hand worker records straight to the handlers that write them, not to
+    # the root logger's QueueHandler, which would queue them a second time
+    root_logger = logging.getLogger()
+    handlers = get_handlers(root_logger)
+    level = max(
+        root_logger.getEffectiveLevel(),
+        min((handler.level for handler in handlers), default=logging.NOTSET),
+    )
+    
+    log_queue = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(log_queue, level),
+        ) as executor:
+            results = list(executor.map(_process_one, tasks, chunksize=4))
+    finally:
+        listener.stop()
+    
+    failed = [(path, error) for path, _, error in results if error is not None]
+    total_records = sum(count for _, count, _ in results)
+    
+    print("\n" + "=" * 60)
+    print("Batch processing complete")
+    print("=" * 60)
+    print(f"Input directory: {input_dir}")
+    print(f"Files processed: {len(results) - len(failed)}/{len(results)}")
+    print(f"Records parsed:  {total_records}")
+    print(f"Output format:   {args.format}")
+    for path, error in failed:
+        print(f"FAILED:          {Path(path).name}: {error}")
+    print("=" * 60 + "\n")
+    
+    return 1 if failed else 0
+
+
 def main():
     """Main application entry point.
     
@@ -116,13 +437,26 @@ def main():
     # Parse arguments
     args = parse_arguments()
     
-    # Setup logging
+    # Setup logging. None of the configured formats include thread or
+    # process fields, so skip collecting them for every LogRecord
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     setup_logging(verbose=args.verbose)
     logger = logging.getLogger(__name__)
     
     # Log startup
-    logger.info(f"GeoData-Standardizer v{APP_CONFIG['version']}")
-    logger.info(f"Processing {args.type} data from {args.input}")
+    logger.info("GeoData-Standardizer v%s", APP_CONFIG['version'])
+    
+    if args.input_dir:
+        try:
+            return run_batch(args)
+        except KeyboardInterrupt:
+            print("\n\nOperation cancelled by user", file=sys.stderr)
+            logger.info("Operation cancelled by user")
+            return 130
+    
+    logger.info("Processing %s data from %s", args.type, args.input)
     
     try:
         # Validate input
@@ -135,47 +469,14 @@ def main():
         else:
             output_path = get_output_path(input_path, format=args.format)
         
-        logger.info(f"Output will be written to: {output_path}")
-        
-        # Step 1: Parse data
-        logger.info("Step 1/4: Parsing data...")
-        dispatcher = Dispatcher()
-        parser = dispatcher.get_parser(args.type, input_path)
-        parsed_data = parser.process(skip_validation=True)
-        logger.info(f"✓ Parsed {parsed_data['metadata']['record_count']} records")
+        logger.info("Output will be written to: %s", output_path)
         
-        # Step 2: Quality control (optional)
-        qc_result = None
-        if not args.skip_qc:
-            logger.info("Step 2/4: Running quality control checks...")
-            qc_checker = QCChecker()
-            qc_result = qc_checker.check(parsed_data)
-            
-            if qc_result['passed']:
-                logger.info("✓ QC checks passed")
-            else:
-                logger.warning("⚠ QC checks found issues:")
-                for issue in qc_result['issues']:
-                    logger.warning(f"  - {issue}")
-            
-            if qc_result.get('warnings'):
-                logger.info("QC warnings:")
-                for warning in qc_result['warnings']:
-                    logger.info(f"  - {warning}")
-        else:
-            logger.info("Step 2/4: Skipping quality control checks")
-        
-        # Step 3: Validate data
-        logger.info("Step 3/4: Validating data...")
-        parser.validate()
-        logger.info("✓ Validation passed")
+        if args.stream:
+            return run_streaming(args, input_path, output_path)
         
-        # Step 4: Standardize and output
-        logger.info("Step 4/4: Standardizing and writing output...")
-        standardizer = Standardizer(output_format=args.format)
-        standardized_data = standardizer.standardize(parsed_data, args.type)
-        standardizer.write_output(standardized_data, output_path)
-        logger.info(f"✓ Output written to {output_path}")
+        parsed_data, qc_result = run_pipeline(
+            input_path, args.type, output_path, args.format, args.skip_qc
+        )
         
         # Print summary
         print("\n" + "=" * 60)
@@ -204,7 +505,7 @@ def main():
         return 130
         
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=args.verbose)
+        logger.error("Error: %s", e, exc_info=args.verbose)
         print(f"\nError: {e}", file=sys.stderr)
         
         if args.verbose:
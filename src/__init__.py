@@ -3,11 +3,20 @@
 A Python tool for standardizing geophysical data formats.
 """
 
+from ._lazy import lazy_exports
+
 __version__ = '0.1.0'
 __author__ = 'GeoData-Standardizer Contributors'
 
-from .core.base_parser import BaseParser, ParserError, ValidationError, FileFormatError
-from .core.dispatcher import Dispatcher
+# Public names are resolved lazily (PEP 562) so that importing lightweight
+# submodules such as src.config does not pull in pandas and the parsers.
+_LAZY = {
+    'BaseParser': ('.core.base_parser', 'BaseParser'),
+    'ParserError': ('.core.base_parser', 'ParserError'),
+    'ValidationError': ('.core.base_parser', 'ValidationError'),
+    'FileFormatError': ('.core.base_parser', 'FileFormatError'),
+    'Dispatcher': ('.core.dispatcher', 'Dispatcher'),
+}
 
 __all__ = [
     'BaseParser',
@@ -16,3 +25,5 @@ __all__ = [
     'FileFormatError',
     'Dispatcher',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY)
@@ -0,0 +1,45 @@
+"""Lazy (PEP 562) attribute exports shared by the package __init__ modules."""
+
+import importlib
+from typing import Any, Callable, Dict, List, MutableMapping, Tuple
+
+
+def lazy_exports(
+    package: str,
+    namespace: MutableMapping[str, Any],
+    exports: Dict[str, Tuple[str, str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module-level __getattr__ and __dir__ functions for lazy exports.
+    
+    Each public name is imported from its submodule on first access and
+    then stored in the package namespace, so later lookups bypass
+    __getattr__.
+    
+    Args:
+        package: Name of the package (its ``__name__``).
+        namespace: The package's ``globals()``.
+        exports: Mapping of public name to (relative module, attribute).
+    
+    Returns:
+        Tuple of (__getattr__, __dir__) for the package.
+    
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY)
+    """
+    def __getattr__(name: str) -> Any:
+        """Import public names on first access."""
+        try:
+            module_name, attr = exports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(module_name, package), attr)
+        namespace[name] = value
+        return value
+    
+    def __dir__() -> List[str]:
+        """Include lazily imported names in dir()."""
+        return sorted(set(namespace) | set(exports))
+    
+    return __getattr__, __dir__
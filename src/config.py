@@ -6,7 +6,8 @@ including paths, logging configuration, parser settings, and QC thresholds.
 
 from pathlib import Path
 import logging
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 
 # Base directories
@@ -58,13 +59,31 @@ LOGGING_CONFIG = {
 }
 
 
-# Parser configuration
-PARSER_CONFIG = {
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples.
+    
+    Args:
+        value: Configuration value to freeze.
+    
+    Returns:
+        Immutable equivalent of the value.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Parser configuration (read-only; built once at import)
+PARSER_CONFIG = _freeze({
     'electrical': {
         'supported_extensions': ['.dat', '.txt', '.csv'],
         'encoding': 'utf-8',
         'required_columns': ['station_id', 'depth_m', 'resistivity_ohm_m'],
         'optional_columns': ['current_ma', 'voltage_mv', 'latitude', 'longitude'],
+        'string_columns': ['station_id'],  # All other columns are numeric
+        'float_dtype': 'float64',  # 'float32' halves memory, ~7 significant digits
         'value_ranges': {
             'depth_m': (0, 10000),
             'resistivity_ohm_m': (0.001, 1e6),
@@ -77,6 +96,7 @@ PARSER_CONFIG = {
         'encoding': 'utf-8',
         'required_columns': ['trace_number', 'time_ms', 'amplitude'],
         'optional_columns': ['station_id', 'offset_m', 'elevation_m'],
+        'string_columns': ['station_id'],  # All other columns are numeric
         'value_ranges': {
             'time_ms': (0, 100000),
             'amplitude': (-1e6, 1e6),
@@ -88,6 +108,7 @@ PARSER_CONFIG = {
         'encoding': 'utf-8',
         'required_columns': ['trace_number', 'sample_number', 'amplitude'],
         'optional_columns': ['distance_m', 'time_ns', 'antenna_freq_mhz'],
+        'string_columns': [],  # All other columns are numeric
         'value_ranges': {
             'sample_number': (0, 100000),
             'amplitude': (-32768, 32767),
@@ -96,7 +117,7 @@ PARSER_CONFIG = {
             'antenna_freq_mhz': (10, 5000),
         },
     },
-}
+})
 
 
 # Standardization configuration
@@ -129,6 +150,7 @@ QC_CONFIG = {
         'check_duplicates': True,
         'check_outliers': True,
         'check_ranges': True,
+        'check_schema': True,
         'check_dtypes': True,
     },
 }
@@ -139,7 +161,10 @@ OUTPUT_CONFIG = {
     'compression': {
         'csv': None,
         'json': None,
-        'parquet': 'snappy',
+        'parquet': 'zstd',
+    },
+    'compression_level': {
+        'parquet': 1,  # zstd level 1: smaller than snappy at similar speed
     },
     'encoding': 'utf-8',
     'include_metadata': True,
@@ -156,18 +181,20 @@ APP_CONFIG = {
     'default_encoding': 'utf-8',
     'max_file_size_mb': 1000,  # Maximum file size to process
     'chunk_size': 10000,  # Rows per chunk for large files
+    'mmap_threshold_mb': 64,  # Parse files this large from a memory map
+    'validation_cache_size': 0,  # Validated files process() remembers; 0 = off
     'verbose': False,
 }
 
 
-def get_parser_config(data_type: str) -> Dict[str, Any]:
+def get_parser_config(data_type: str) -> Mapping[str, Any]:
     """Get configuration for a specific parser type.
     
     Args:
         data_type: Type of geophysical data.
     
     Returns:
-        Configuration dictionary for the parser.
+        Read-only configuration mapping for the parser.
     
     Raises:
         ValueError: If data_type is not recognized.
@@ -180,13 +207,16 @@ def get_parser_config(data_type: str) -> Dict[str, Any]:
     return PARSER_CONFIG[data_type]
 
 
-def setup_logging(verbose: bool = False) -> None:
+def setup_logging(verbose: bool = False, use_queue: bool = True) -> None:
     """Set up logging configuration.
     
     Args:
         verbose: If True, set console handler to DEBUG level.
+        use_queue: If True, the root logger's handlers run on a background
+            QueueListener thread so logging never blocks the caller on I/O.
     """
     import logging.config
+    from .utils.logger import enable_queue_logging, stop_queue_logging
     
     # Ensure logs directory exists
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
@@ -196,7 +226,14 @@ def setup_logging(verbose: bool = False) -> None:
     if verbose:
         config['handlers']['console']['level'] = 'DEBUG'
     
+    # Stop a previous listener before dictConfig closes its handlers
+    root_logger = logging.getLogger()
+    stop_queue_logging(root_logger)
+    
     logging.config.dictConfig(config)
+    
+    if use_queue:
+        enable_queue_logging(root_logger)
 
 
 def get_output_path(
@@ -264,5 +301,6 @@ def validate_config() -> bool:
     return True
 
 
-# Validate configuration on import
-validate_config()
+# Validate configuration on import (skipped under ``python -O``)
+if __debug__:
+    validate_config()
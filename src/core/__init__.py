@@ -1,7 +1,15 @@
 """Core parsing functionality."""
 
-from .base_parser import BaseParser, ParserError, ValidationError, FileFormatError
-from .dispatcher import Dispatcher
+from .._lazy import lazy_exports
+
+# Resolved lazily (PEP 562); see src/__init__.py
+_LAZY = {
+    'BaseParser': ('.base_parser', 'BaseParser'),
+    'ParserError': ('.base_parser', 'ParserError'),
+    'ValidationError': ('.base_parser', 'ValidationError'),
+    'FileFormatError': ('.base_parser', 'FileFormatError'),
+    'Dispatcher': ('.dispatcher', 'Dispatcher'),
+}
 
 __all__ = [
     'BaseParser',
@@ -10,3 +18,5 @@ __all__ = [
     'FileFormatError',
     'Dispatcher',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY)
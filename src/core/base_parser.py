@@ -5,12 +5,70 @@ various geophysical data formats.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, Iterator
+from io import StringIO
+import asyncio
+import csv
+import threading
+import mmap
+import os
+import stat
+import numpy as np
 import pandas as pd
 import logging
+import time
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - pyarrow is an optional speedup
+    pa = None
+    pacsv = None
+
+from ..config import APP_CONFIG, OUTPUT_CONFIG, PARSER_CONFIG
+
+
+# Arrow types for the column_dtypes values the CSV reader can decode into
+# (it rejects integers that overflow, and the file is then re-read untyped)
+_ARROW_TYPES = {
+    'int16': pa.int16(),
+    'int32': pa.int32(),
+    'int64': pa.int64(),
+    'float32': pa.float32(),
+    'float64': pa.float64(),
+    'category': pa.dictionary(pa.int32(), pa.string()),
+} if pa is not None else {}
+
+
+# Expected types of the required columns, per data type
+_REQUIRED_TYPES = {
+    data_type: {
+        col: 'numeric' for col in cfg['required_columns']
+        if col not in cfg['string_columns']
+    }
+    for data_type, cfg in PARSER_CONFIG.items()
+}
+
+# dtype predicates for the type names accepted by _check_data_types()
+_TYPE_CHECKS = {
+    'numeric': pd.api.types.is_numeric_dtype,
+    'string': pd.api.types.is_string_dtype,
+}
+
+# Files that passed validate() in process(), keyed by _validation_key() and
+# kept in LRU order; only used if APP_CONFIG['validation_cache_size'] > 0
+_VALIDATED_FILES: 'OrderedDict[Tuple, None]' = OrderedDict()
+_VALIDATED_FILES_LOCK = threading.Lock()
+
+
+def _is_integer_dtype(dtype: str) -> bool:
+    """Check whether a column_dtypes value names a numpy integer dtype."""
+    return dtype != 'category' and np.dtype(dtype).kind in 'iu'
+
 
 class ParserError(Exception):
     """Base exception for parser errors."""
@@ -57,6 +115,24 @@ class BaseParser(ABC):
         >>> parser.process()
     """
     
+    # Mapping from source column names to standardized names (per subclass)
+    column_map: Dict[str, str] = {}
+    
+    # Key of this parser's data type in PARSER_CONFIG (per subclass)
+    data_type: Optional[str] = None
+    
+    # dtypes to parse standardized columns as, skipping type inference
+    # (per subclass)
+    column_dtypes: Dict[str, str] = {}
+    
+    # Normalized column_map lookup, built once per class
+    _column_map_lookup: Dict[str, str] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        """Build the normalized column_map lookup when a parser is defined."""
+        super().__init_subclass__(**kwargs)
+        cls._column_map_lookup = cls._column_lookup(cls.column_map)
+    
     def __init__(
         self,
         file_path: Union[str, Path],
@@ -79,21 +155,32 @@ class BaseParser(ABC):
         self._metadata: Dict[str, Any] = {
             'file_name': self._file_path.name,
             'file_path': str(self._file_path),
-            'created_at': datetime.now().isoformat(),
         }
+        # Formatted into metadata['created_at'] on first access
+        self._created_at = time.time()
         self._data: Optional[pd.DataFrame] = None
         self._raw_data: Optional[str] = None
+        self._memory_mapped = False
+        self._mmap: Optional[mmap.mmap] = None
         self._is_loaded = False
         self._is_parsed = False
         self._is_validated = False
         self._extra_params = kwargs
         
-        # Set up logger
-        self.logger = logging.getLogger(self.__class__.__name__)
-        
         # Validate file path on initialization
         self._validate_file_path()
     
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_logger(cls) -> logging.Logger:
+        """Get the logger for this parser class, looked up once per class."""
+        return logging.getLogger(cls.__name__)
+    
+    @property
+    def logger(self) -> logging.Logger:
+        """Logger named after the parser class."""
+        return self._get_logger()
+    
     @property
     def file_path(self) -> Path:
         """Get the file path."""
@@ -107,6 +194,10 @@ class BaseParser(ABC):
     @property
     def metadata(self) -> Dict[str, Any]:
         """Get metadata dictionary."""
+        if 'created_at' not in self._metadata:
+            self._metadata['created_at'] = datetime.fromtimestamp(
+                self._created_at
+            ).isoformat()
         return self._metadata
     
     @property
@@ -116,9 +207,52 @@ class BaseParser(ABC):
     
     @property
     def raw_data(self) -> Optional[str]:
-        """Get raw data."""
+        """Get raw data.
+        
+        Parsers that read straight from the file (or from a memory map) do
+        not keep the text, so it is only read from disk if requested here.
+        """
+        if self._raw_data is None and self._is_loaded:
+            with open(self.file_path, 'r', encoding=self.encoding) as f:
+                self._raw_data = f.read()
         return self._raw_data
     
+    @property
+    def raw_buffer(self) -> memoryview:
+        """Get the file contents as a read-only, zero-copy buffer.
+        
+        The file is memory-mapped on first access, so the bytes are paged in
+        on demand instead of being copied into a Python string. The map is
+        shared with _read_csv() and released by close().
+        """
+        if self._mmap is None:
+            with open(self.file_path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+        return memoryview(self._mmap)
+    
+    def close(self) -> None:
+        """Release the memory map behind raw_buffer, if one was created.
+        
+        If a buffer exported from the map is still in use (e.g. by Arrow),
+        the map is instead released with its last reference.
+        """
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+            self._mmap = None
+    
+    def __enter__(self) -> 'BaseParser':
+        """Use the parser as a context manager that calls close() on exit."""
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        """Release the memory map on leaving the context."""
+        self.close()
+    
     @property
     def is_loaded(self) -> bool:
         """Check if data has been loaded."""
@@ -141,14 +275,221 @@ class BaseParser(ABC):
             FileNotFoundError: If file does not exist.
             PermissionError: If file is not readable.
         """
-        if not self._file_path.exists():
+        # A single stat() answers all three checks
+        try:
+            st = os.stat(self._file_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {self._file_path}")
         
-        if not self._file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ParserError(f"Path is not a file: {self._file_path}")
         
-        if not self._file_path.stat().st_size > 0:
+        if not st.st_size > 0:
             raise ParserError(f"File is empty: {self._file_path}")
+        
+        self._file_size = st.st_size
+        self._file_stat = st
+    
+    def _stat_source(self) -> int:
+        """Get the input file size (from the stat done at init) without reading it.
+        
+        Files at or above APP_CONFIG['mmap_threshold_mb'] are flagged to be
+        parsed from a read-only memory map by _read_csv().
+        
+        Returns:
+            Size of the file in bytes.
+        """
+        size = self._file_size
+        self._memory_mapped = (
+            pacsv is not None and size >= APP_CONFIG['mmap_threshold_mb'] * 1024**2
+        )
+        return size
+    
+    def _load_source(self) -> int:
+        """Prepare the file contents for parsing.
+        
+        Large files (see _stat_source()) are not read into memory here;
+        _read_csv() parses them directly from a memory map instead. Smaller
+        files are read into self._raw_data.
+        
+        Returns:
+            Size of the loaded content.
+        """
+        size = self._stat_source()
+        if self._memory_mapped:
+            return size
+        
+        with open(self.file_path, 'r', encoding=self.encoding) as f:
+            self._raw_data = f.read()
+        return len(self._raw_data)
+    
+    def _read_csv(self) -> pd.DataFrame:
+        """Read the loaded CSV content into a DataFrame.
+        
+        Parses self._raw_data if load() read the text, and the file itself
+        otherwise. Uses pyarrow's multithreaded CSV reader when it is
+        installed and falls back to the pandas C parser otherwise.
+        
+        Returns:
+            DataFrame with the columns as found in the file.
+        """
+        dtypes = self._source_dtypes()
+        
+        if pacsv is None:
+            if self._raw_data is not None:
+                source, options = StringIO(self._raw_data), {}
+            else:
+                source = self.file_path
+                options = {'encoding': self.encoding, 'memory_map': True}
+            # The C parser wraps integers that overflow a narrow dtype, so
+            # those are only cast (with a range check) after reading
+            reader_dtypes = {
+                column: dtype for column, dtype in dtypes.items()
+                if not _is_integer_dtype(dtype)
+            }
+            try:
+                df = pd.read_csv(
+                    source, engine='c', low_memory=False, dtype=reader_dtypes, **options
+                )
+            except (ValueError, TypeError):
+                # A column does not fit its dtype; leave it to validation
+                if isinstance(source, StringIO):
+                    source.seek(0)
+                df = pd.read_csv(source, engine='c', low_memory=False, **options)
+            return self._apply_dtypes(df, dtypes)
+        
+        read_options = pacsv.ReadOptions(
+            use_threads=True,
+            block_size=APP_CONFIG['chunk_size'] * 1024,
+            # In-memory text is re-encoded as UTF-8 below
+            encoding=self.encoding if self._raw_data is None else 'utf8',
+        )
+        
+        if self._raw_data is not None:
+            source = pa.py_buffer(self._raw_data.encode('utf-8'))
+        elif self._memory_mapped:
+            source = pa.py_buffer(self.raw_buffer)
+        else:
+            source = None
+        
+        def read(column_types: Dict[str, Any]) -> 'pa.Table':
+            # Match pandas, which treats empty string fields as missing
+            convert_options = pacsv.ConvertOptions(
+                strings_can_be_null=True, column_types=column_types
+            )
+            return pacsv.read_csv(
+                pa.BufferReader(source) if source is not None else str(self.file_path),
+                read_options=read_options,
+                convert_options=convert_options,
+            )
+        
+        # Let the reader decode straight into the declared types
+        column_types = {
+            column: _ARROW_TYPES[dtype] for column, dtype in dtypes.items()
+            if dtype in _ARROW_TYPES
+        }
+        try:
+            table = read(column_types)
+        except pa.ArrowInvalid:
+            if not column_types:
+                raise
+            # A column does not fit its type; leave it to validation
+            table = read({})
+        df = table.to_pandas()
+        return self._apply_dtypes(df, dtypes)
+    
+    def _source_dtypes(self) -> Dict[str, str]:
+        """Map the file's column names to the dtypes in column_dtypes.
+        
+        Only the header line is read, so the dtypes can be passed to the CSV
+        reader before the source columns are renamed.
+        
+        Returns:
+            Dictionary mapping source column names to dtypes.
+        """
+        if not self.column_dtypes:
+            return {}
+        
+        if self._raw_data is not None:
+            end = self._raw_data.find('\n')
+            header_line = self._raw_data if end < 0 else self._raw_data[:end]
+        else:
+            with open(self.file_path, 'r', encoding=self.encoding) as f:
+                header_line = f.readline()
+        header = next(csv.reader([header_line]), [])
+        
+        lookup = self._lookup_for(self.column_map)
+        dtypes = {}
+        for column in header:
+            standard_name = lookup.get(column.strip().lower(), column)
+            if standard_name in self.column_dtypes:
+                dtypes[column] = self.column_dtypes[standard_name]
+        return dtypes
+    
+    @staticmethod
+    def _apply_dtypes(df: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+        """Cast parsed columns to their configured dtypes.
+        
+        Numeric targets are only applied to columns that were parsed as
+        numbers, and integer targets only to integer columns that fit, so
+        non-numeric and out-of-range values are left for validation to
+        report.
+        
+        Args:
+            df: DataFrame as read from the file.
+            dtypes: Dictionary mapping column names to dtypes.
+        
+        Returns:
+            DataFrame with the dtypes applied.
+        """
+        casts = {}
+        for column, dtype in dtypes.items():
+            if column not in df.columns or df[column].dtype == dtype:
+                continue
+            source_dtype = df[column].dtype
+            if _is_integer_dtype(dtype):
+                # Only integer columns whose values all fit; columns with
+                # missing or fractional values keep their parsed dtype
+                if not (isinstance(source_dtype, np.dtype) and source_dtype.kind in 'iu'):
+                    continue
+                values = df[column].to_numpy()
+                info = np.iinfo(dtype)
+                if values.size and (values.min() < info.min or values.max() > info.max):
+                    continue
+            elif dtype != 'category' and not pd.api.types.is_numeric_dtype(source_dtype):
+                continue
+            casts[column] = dtype
+        return df.astype(casts) if casts else df
+    
+    @staticmethod
+    def _column_ranges(
+        df: pd.DataFrame,
+        columns: List[str]
+    ) -> Dict[str, Tuple[Any, Any]]:
+        """Get the (min, max) range of each column present in a frame.
+        
+        Plain numpy numeric columns are reduced directly on their arrays with
+        NaN-ignoring np.fmin/np.fmax, skipping the pandas reduction machinery;
+        other columns use Series.min()/max().
+        
+        Args:
+            df: DataFrame to summarize.
+            columns: Columns to get ranges for; missing ones are skipped.
+        
+        Returns:
+            Mapping of column name to (min, max).
+        """
+        ranges = {}
+        for col in columns:
+            if col not in df:
+                continue
+            series = df[col]
+            if len(series) and isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iuf':
+                values = series.to_numpy()
+                ranges[col] = (np.fmin.reduce(values), np.fmax.reduce(values))
+            else:
+                ranges[col] = (series.min(), series.max())
+        return ranges
     
     def _check_required_columns(
         self,
@@ -177,6 +518,9 @@ class BaseParser(ABC):
     ) -> None:
         """Check if values are within expected ranges.
         
+        Every column is checked before raising, so a single ValidationError
+        reports all out-of-range columns.
+        
         Args:
             data: DataFrame to check.
             range_map: Dictionary mapping column names to (min, max) tuples.
@@ -184,48 +528,71 @@ class BaseParser(ABC):
         Raises:
             ValidationError: If values are out of range.
         """
+        errors = []
         for column, (min_val, max_val) in range_map.items():
             if column not in data.columns:
                 continue
             
-            out_of_range = (
-                (data[column] < min_val) | (data[column] > max_val)
-            ).sum()
+            values = data[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            if values.size == 0:
+                continue
+            
+            # Two NaN-ignoring reductions, no temporary masks, settle the
+            # common all-valid case; only count when a bound is crossed
+            low, high = np.fmin.reduce(values), np.fmax.reduce(values)
+            if not (low < min_val or high > max_val):
+                continue
             
+            out_of_range = np.count_nonzero((values < min_val) | (values > max_val))
             if out_of_range > 0:
-                raise ValidationError(
+                errors.append(
                     f"Column '{column}' has {out_of_range} values out of "
                     f"range [{min_val}, {max_val}]"
                 )
+        
+        if errors:
+            raise ValidationError("; ".join(errors))
     
     def _check_data_types(
         self,
         data: pd.DataFrame,
-        type_map: Dict[str, type]
+        type_map: Dict[str, str]
     ) -> None:
         """Check if columns have expected data types.
         
+        The check only inspects the frame's dtypes, never the values.
+        
         Args:
             data: DataFrame to check.
-            type_map: Dictionary mapping column names to expected types.
+            type_map: Dictionary mapping column names to expected types
+                ('numeric' or 'string').
         
         Raises:
             ValidationError: If data types don't match.
         """
-        for column, expected_type in type_map.items():
-            if column not in data.columns:
-                continue
-            
-            if expected_type == 'numeric':
-                if not pd.api.types.is_numeric_dtype(data[column]):
-                    raise ValidationError(
-                        f"Column '{column}' must be numeric"
-                    )
-            elif expected_type == 'string':
-                if not pd.api.types.is_string_dtype(data[column]):
-                    raise ValidationError(
-                        f"Column '{column}' must be string"
-                    )
+        dtypes = data.dtypes
+        for expected_type, is_expected in _TYPE_CHECKS.items():
+            mismatched = [
+                column for column, column_type in type_map.items()
+                if column_type == expected_type
+                and column in dtypes.index
+                and not is_expected(dtypes[column])
+            ]
+            if mismatched:
+                raise ValidationError(
+                    f"Columns must be {expected_type}: {', '.join(mismatched)}"
+                )
+    
+    def _check_required_types(self, data: pd.DataFrame) -> None:
+        """Check that the required non-string columns are numeric.
+        
+        Args:
+            data: DataFrame to check.
+        
+        Raises:
+            ValidationError: If a required column has the wrong type.
+        """
+        self._check_data_types(data, _REQUIRED_TYPES.get(self.data_type, {}))
     
     def _standardize_column_names(
         self,
@@ -234,6 +601,10 @@ class BaseParser(ABC):
     ) -> pd.DataFrame:
         """Standardize column names according to mapping.
         
+        Column names are matched case-insensitively and ignoring
+        surrounding whitespace, so 'Depth' and ' DEPTH ' both match a
+        'depth' entry.
+        
         Args:
             data: DataFrame with columns to rename.
             column_map: Dictionary mapping old names to new names.
@@ -241,13 +612,53 @@ class BaseParser(ABC):
         Returns:
             DataFrame with standardized column names.
         """
-        # Only rename columns that exist
-        rename_dict = {
-            old: new for old, new in column_map.items()
-            if old in data.columns
-        }
+        lookup = self._lookup_for(column_map)
+        
+        # Only rename columns that exist under a different name
+        rename_dict = {}
+        for column in data.columns:
+            new = lookup.get(str(column).strip().lower())
+            if new is not None and new != column:
+                rename_dict[column] = new
+        
+        # rename() copies the frame, so skip it when there is nothing to do
+        if not rename_dict:
+            return data
         return data.rename(columns=rename_dict)
     
+    @staticmethod
+    def _column_lookup(column_map: Dict[str, str]) -> Dict[str, str]:
+        """Key a column map by normalized (stripped, lowercase) source name.
+        
+        The standardized names are included too, so a column already named
+        e.g. 'Amplitude' is normalized to 'amplitude'.
+        
+        Args:
+            column_map: Dictionary mapping old names to new names.
+        
+        Returns:
+            Dictionary mapping normalized old names to new names.
+        """
+        lookup = {new.lower(): new for new in column_map.values()}
+        lookup.update((old.strip().lower(), new) for old, new in column_map.items())
+        return lookup
+    
+    def _lookup_for(self, column_map: Dict[str, str]) -> Dict[str, str]:
+        """Get the normalized lookup for a column map.
+        
+        The lookup for the class's own column_map is built once per class
+        (see __init_subclass__); other maps are normalized on each call.
+        
+        Args:
+            column_map: Dictionary mapping old names to new names.
+        
+        Returns:
+            Dictionary mapping normalized old names to new names.
+        """
+        if column_map is type(self).column_map:
+            return type(self)._column_map_lookup
+        return self._column_lookup(column_map)
+    
     def _remove_duplicates(
         self,
         data: pd.DataFrame,
@@ -269,7 +680,7 @@ class BaseParser(ABC):
         removed_count = initial_count - len(data)
         
         if removed_count > 0:
-            self.logger.info(f"Removed {removed_count} duplicate rows")
+            self.logger.info("Removed %d duplicate rows", removed_count)
         
         return data
     
@@ -302,12 +713,54 @@ class BaseParser(ABC):
         
         return data
     
+    def _clean(
+        self,
+        data: pd.DataFrame,
+        subset: Optional[List[str]] = None,
+        keep: str = 'first',
+        na_strategy: str = 'drop'
+    ) -> pd.DataFrame:
+        """Remove duplicate rows and handle missing values in one pass.
+        
+        With the 'drop' strategy, rows that are duplicates or have a missing
+        value in ``subset`` are removed with a single boolean mask, so no
+        intermediate frame is built between the two steps. Other strategies
+        fall back to _handle_missing_values() followed by _remove_duplicates().
+        
+        Args:
+            data: DataFrame to clean.
+            subset: Columns to consider for duplicates and missing values
+                (default: all columns).
+            keep: Which duplicates to keep ('first', 'last', False).
+            na_strategy: How to handle missing values (see
+                _handle_missing_values()).
+        
+        Returns:
+            Cleaned DataFrame.
+        """
+        if na_strategy != 'drop':
+            data = self._handle_missing_values(data, strategy=na_strategy)
+            return self._remove_duplicates(data, subset=subset, keep=keep)
+        
+        columns = data if subset is None else data[subset]
+        mask = ~data.duplicated(subset=subset, keep=keep).to_numpy()
+        mask &= columns.notna().all(axis=1).to_numpy()
+        
+        removed_count = len(data) - int(mask.sum())
+        if removed_count > 0:
+            self.logger.info("Removed %d duplicate or incomplete rows", removed_count)
+            data = data.loc[mask]
+        
+        return data
+    
     @abstractmethod
     def load(self) -> None:
         """Load data from file.
         
-        This method should read the file and populate self._raw_data.
-        It should also set self._is_loaded to True on success.
+        This method should read the file and populate self._raw_data
+        (typically via _load_source()), or only stat it if parse() reads
+        from the file path. It should also set self._is_loaded to True on
+        success.
         
         Raises:
             ParserError: If loading fails.
@@ -364,7 +817,7 @@ class BaseParser(ABC):
         Raises:
             ParserError: If any step fails.
         """
-        self.logger.info(f"Processing {self.file_path.name}")
+        self.logger.info("Processing %s", self.file_path.name)
         
         # Load
         if not self.is_loaded:
@@ -376,16 +829,159 @@ class BaseParser(ABC):
         else:
             result = {'metadata': self.metadata, 'data': self.data}
         
-        # Validate
+        # Validate, unless this exact file already passed with this parser
         if not skip_validation and not self.is_validated:
-            self.validate()
+            cache_size = APP_CONFIG['validation_cache_size']
+            key = self._validation_key() if cache_size > 0 else None
+            with _VALIDATED_FILES_LOCK:
+                cached = key is not None and key in _VALIDATED_FILES
+                if cached:
+                    _VALIDATED_FILES.move_to_end(key)
+            if cached:
+                self._is_validated = True
+                self.logger.debug(
+                    "Skipping validation of %s: file already validated",
+                    self.file_path.name
+                )
+            else:
+                self.validate()
+                if key is not None:
+                    with _VALIDATED_FILES_LOCK:
+                        _VALIDATED_FILES[key] = None
+                        while len(_VALIDATED_FILES) > cache_size:
+                            _VALIDATED_FILES.popitem(last=False)
         
-        self.logger.info(f"Successfully processed {self.file_path.name}")
+        self.logger.info("Successfully processed %s", self.file_path.name)
         return result
     
-    def get_summary(self) -> Dict[str, Any]:
+    async def aprocess(self, skip_validation: bool = False) -> Dict[str, Any]:
+        """Run process() without blocking the event loop.
+        
+        load() only stats the file and the reading happens in parse(), so
+        the whole pipeline runs in a worker thread; the CSV readers release
+        the GIL, letting several files be parsed concurrently from asyncio
+        code (see Dispatcher.aprocess_many()).
+        
+        Args:
+            skip_validation: If True, skip the validation step.
+        
+        Returns:
+            Dictionary containing 'metadata' and 'data' keys.
+        
+        Raises:
+            ParserError: If any step fails.
+        """
+        return await asyncio.to_thread(self.process, skip_validation)
+    
+    def _validation_key(self) -> Tuple:
+        """Identify this parse of this exact file for the validation cache.
+        
+        Any write to the file changes its ctime, so the stat fields identify
+        the contents without reading them; encoding and extra parameters are
+        included because they change the parsed frame.
+        
+        Returns:
+            Hashable key.
+        """
+        st = self._file_stat
+        params = tuple(sorted((k, repr(v)) for k, v in self._extra_params.items()))
+        return (
+            type(self), str(self.file_path.resolve()), st.st_dev, st.st_ino,
+            st.st_size, st.st_mtime_ns, st.st_ctime_ns, self.encoding, params
+        )
+    
+    def parse_iter(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Parse the file incrementally, yielding standardized chunks.
+        
+        The file is streamed from disk, so peak memory is bounded by the chunk
+        size rather than the file size. Unlike parse(), this does not require
+        load() and does not populate self.data.
+        
+        Args:
+            chunk_size: Approximate number of rows per chunk
+                (default: APP_CONFIG['chunk_size']).
+        
+        Yields:
+            DataFrames with standardized column names.
+        
+        Raises:
+            ParserError: If reading the file fails.
+        """
+        if chunk_size is None:
+            chunk_size = APP_CONFIG['chunk_size']
+        
+        record_count = 0
+        try:
+            for chunk in self._iter_csv_chunks(chunk_size):
+                record_count += len(chunk)
+                yield self._standardize_column_names(chunk, self.column_map)
+        except ParserError:
+            raise
+        except Exception as e:
+            raise ParserError(f"Failed to stream {self.file_path.name}: {e}")
+        
+        self._metadata['record_count'] = record_count
+        self.logger.info("Streamed %d records from %s", record_count, self.file_path.name)
+    
+    def _iter_csv_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Stream the CSV file from disk in chunks of roughly chunk_size rows.
+        
+        Args:
+            chunk_size: Approximate number of rows per chunk.
+        
+        Yields:
+            DataFrames with the columns as found in the file.
+        """
+        # Categories would differ from chunk to chunk, so only numeric
+        # dtypes are applied here
+        dtypes = {
+            column: dtype for column, dtype in self._source_dtypes().items()
+            if dtype != 'category'
+        }
+        
+        if pacsv is None:
+            for chunk in pd.read_csv(
+                self.file_path, encoding=self.encoding, chunksize=chunk_size
+            ):
+                yield self._apply_dtypes(chunk, dtypes)
+            return
+        
+        read_options = pacsv.ReadOptions(
+            use_threads=True,
+            block_size=chunk_size * self._estimate_row_bytes(),
+            encoding=self.encoding,
+        )
+        convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+        reader = pacsv.open_csv(
+            str(self.file_path),
+            read_options=read_options,
+            convert_options=convert_options,
+        )
+        for batch in reader:
+            df = batch.to_pandas()
+            yield self._apply_dtypes(df, dtypes)
+    
+    def _estimate_row_bytes(self, sample_size: int = 64 * 1024) -> int:
+        """Estimate the average row width from the start of the file.
+        
+        Args:
+            sample_size: Number of bytes to sample.
+        
+        Returns:
+            Average number of bytes per line (at least 1).
+        """
+        with open(self.file_path, 'rb') as f:
+            sample = f.read(sample_size)
+        return max(1, len(sample) // max(1, sample.count(b'\n')))
+    
+    def get_summary(self, deep: bool = False) -> Dict[str, Any]:
         """Get a summary of the parsed data.
         
+        Args:
+            deep: If True, measure the memory of object columns exactly,
+                which walks every string. By default only the column
+                buffers are counted, which is constant-time per column.
+        
         Returns:
             Dictionary with summary statistics.
         """
@@ -401,7 +997,7 @@ class BaseParser(ABC):
                 'row_count': len(self.data),
                 'column_count': len(self.data.columns),
                 'columns': list(self.data.columns),
-                'memory_usage_mb': self.data.memory_usage(deep=True).sum() / 1024**2,
+                'memory_usage_mb': self.data.memory_usage(deep=deep).sum() / 1024**2,
             })
         
         if self.metadata:
@@ -439,11 +1035,23 @@ class BaseParser(ABC):
             elif format == 'excel':
                 self.data.to_excel(output_path, index=False, **kwargs)
             elif format == 'parquet':
-                self.data.to_parquet(output_path, index=False, **kwargs)
+                options = {
+                    'compression': OUTPUT_CONFIG['compression']['parquet'],
+                    'compression_level': OUTPUT_CONFIG['compression_level']['parquet'],
+                    **kwargs,
+                }
+                if pa is not None:
+                    # Write the Arrow table directly rather than through
+                    # DataFrame.to_parquet()
+                    import pyarrow.parquet as pq
+                    table = pa.Table.from_pandas(self.data, preserve_index=False)
+                    pq.write_table(table, output_path, **options)
+                else:
+                    self.data.to_parquet(output_path, index=False, **options)
             else:
                 raise ValueError(f"Unsupported format: {format}")
             
-            self.logger.info(f"Saved data to {output_path}")
+            self.logger.info("Saved data to %s", output_path)
         except Exception as e:
             raise ParserError(f"Failed to save data: {e}")
     
@@ -1,13 +1,68 @@
 """Dispatcher module to route data to appropriate parser based on file type."""
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, Type
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Type
+import asyncio
+import importlib
 import logging
+import threading
 
 from .base_parser import BaseParser, ParserError
-from ..parsers.elec_parser import ElecParser
-from ..parsers.seismic_parser import SeismicParser
-from ..parsers.radar_parser import RadarParser
+from ..config import PARSER_CONFIG
+
+
+# Built-in parsers by data type as (module, class name); a parser module is
+# only imported the first time its data type is requested
+_PARSER_SPECS = {
+    'electrical': ('..parsers.elec_parser', 'ElecParser'),
+    'seismic': ('..parsers.seismic_parser', 'SeismicParser'),
+    'radar': ('..parsers.radar_parser', 'RadarParser'),
+}
+
+# File extension to data type lookup, built once from PARSER_CONFIG
+# (read-only, as it is shared by every Dispatcher)
+_EXT_TO_TYPE = MappingProxyType({
+    ext: data_type
+    for data_type, cfg in PARSER_CONFIG.items()
+    for ext in cfg['supported_extensions']
+})
+
+
+@lru_cache(maxsize=None)
+def _resolve_parser(data_type: str) -> Type[BaseParser]:
+    """Import and return the built-in parser class for a data type.
+    
+    Args:
+        data_type: Key in _PARSER_SPECS.
+    
+    Returns:
+        Parser class.
+    """
+    module_name, class_name = _PARSER_SPECS[data_type]
+    return getattr(importlib.import_module(module_name, __package__), class_name)
+
+
+def _run_one(
+    parser_class: Type[BaseParser],
+    file_path: str,
+    skip_validation: bool
+) -> Dict[str, Any]:
+    """Parse one file in a worker process.
+    
+    Module-level so it can be pickled by ProcessPoolExecutor.
+    
+    Args:
+        parser_class: Parser class to instantiate.
+        file_path: Path to the data file.
+        skip_validation: Passed through to BaseParser.process().
+    
+    Returns:
+        Result of BaseParser.process().
+    """
+    return parser_class(file_path).process(skip_validation=skip_validation)
 
 
 class Dispatcher:
@@ -29,11 +84,11 @@ class Dispatcher:
     def __init__(self):
         """Initialize the dispatcher with parser mappings."""
         self.logger = logging.getLogger(__name__)
-        self._parser_map = {
-            'electrical': ElecParser,
-            'seismic': SeismicParser,
-            'radar': RadarParser,
-        }
+        # Parsers registered on this instance; built-in types not overridden
+        # here are resolved from _PARSER_SPECS
+        self._parser_map = {}
+        # Serializes registrations; lookups are single dict reads
+        self._lock = threading.Lock()
     
     def get_parser(
         self,
@@ -61,18 +116,20 @@ class Dispatcher:
             >>> ParserClass = dispatcher.get_parser('electrical')
         """
         data_type_lower = data_type.lower()
+        parser_class = self._parser_map.get(data_type_lower)
+        
+        if parser_class is None and data_type_lower in _PARSER_SPECS:
+            parser_class = _resolve_parser(data_type_lower)
         
-        if data_type_lower not in self._parser_map:
-            available_types = ', '.join(self._parser_map.keys())
+        if parser_class is None:
+            available_types = ', '.join(self.get_supported_types())
             raise ParserError(
                 f"Unknown data type: '{data_type}'. "
                 f"Available types: {available_types}"
             )
         
-        parser_class = self._parser_map[data_type_lower]
-        
         if file_path:
-            self.logger.info(f"Creating {data_type} parser for {file_path}")
+            self.logger.info("Creating %s parser for %s", data_type, file_path)
             return parser_class(file_path, **kwargs)
         
         return parser_class
@@ -94,30 +151,18 @@ class Dispatcher:
             >>> data_type = dispatcher.detect_type('survey.sgy')
             >>> print(data_type)  # 'seismic'
         """
-        file_path = Path(file_path)
-        ext = file_path.suffix.lower()
-        
-        # Extension to data type mapping
-        extension_map = {
-            '.dat': 'electrical',
-            '.txt': 'electrical',
-            '.csv': 'electrical',
-            '.sgy': 'seismic',
-            '.segy': 'seismic',
-            '.dzt': 'radar',
-            '.rd3': 'radar',
-        }
-        
-        if ext in extension_map:
-            detected_type = extension_map[ext]
+        ext = Path(file_path).suffix.lower()
+        detected_type = _EXT_TO_TYPE.get(ext)
+        
+        if detected_type is not None:
             self.logger.info(
-                f"Detected data type '{detected_type}' from extension '{ext}'"
+                "Detected data type '%s' from extension '%s'", detected_type, ext
             )
             return detected_type
         
         raise ParserError(
             f"Cannot detect data type from extension: '{ext}'. "
-            f"Supported extensions: {', '.join(extension_map.keys())}"
+            f"Supported extensions: {', '.join(_EXT_TO_TYPE.keys())}"
         )
     
     def get_supported_types(self) -> list:
@@ -126,12 +171,15 @@ class Dispatcher:
         Returns:
             List of supported data type strings.
         """
-        return list(self._parser_map.keys())
+        with self._lock:
+            registered = list(self._parser_map)
+        return list(dict.fromkeys([*_PARSER_SPECS, *registered]))
     
     def register_parser(self, data_type: str, parser_class: Type[BaseParser]) -> None:
         """Register a new parser type.
         
-        This allows extending the dispatcher with custom parsers.
+        This allows extending the dispatcher with custom parsers. Safe to
+        call from several threads at once.
         
         Args:
             data_type: Name for the data type.
@@ -152,5 +200,94 @@ class Dispatcher:
                 f"got {parser_class.__name__}"
             )
         
-        self._parser_map[data_type.lower()] = parser_class
-        self.logger.info(f"Registered parser '{parser_class.__name__}' for type '{data_type}'")
+        with self._lock:
+            self._parser_map[data_type.lower()] = parser_class
+        self.logger.info("Registered parser '%s' for type '%s'", parser_class.__name__, data_type)
+    
+    def process_many(
+        self,
+        paths: Iterable[Union[str, Path]],
+        max_workers: Optional[int] = None,
+        skip_validation: bool = False
+    ) -> Iterator[Tuple[Union[str, Path], Union[Dict[str, Any], Exception]]]:
+        """Process several files in parallel worker processes.
+        
+        Each file's data type is detected from its extension and the file is
+        parsed in a ProcessPoolExecutor, so CSV parsing (and the GIL-holding
+        parts of pandas) scale across cores.
+        
+        Args:
+            paths: Files to process.
+            max_workers: Number of worker processes (default: CPU count).
+            skip_validation: If True, skip the validation step.
+        
+        Yields:
+            (path, result) tuples in completion order, where result is the
+            dictionary returned by BaseParser.process() or the exception
+            raised for that file.
+        
+        Example:
+            >>> dispatcher = Dispatcher()
+            >>> for path, result in dispatcher.process_many(['a.csv', 'b.sgy']):
+            ...     if isinstance(result, Exception):
+            ...         print(f"{path} failed: {result}")
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for path in paths:
+                try:
+                    parser_class = self.get_parser(self.detect_type(path))
+                except ParserError as e:
+                    yield path, e
+                    continue
+                future = executor.submit(
+                    _run_one, parser_class, str(path), skip_validation
+                )
+                futures[future] = path
+            
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    yield path, future.result()
+                except Exception as e:
+                    yield path, e
+    
+    async def aprocess_many(
+        self,
+        paths: Iterable[Union[str, Path]],
+        max_concurrency: int = 32,
+        skip_validation: bool = False
+    ) -> List[Tuple[Union[str, Path], Union[Dict[str, Any], Exception]]]:
+        """Process several files concurrently from asyncio code.
+        
+        Each file is run through BaseParser.aprocess() in a worker
+        thread, with at most ``max_concurrency`` files in flight so
+        concurrent reads keep the storage queue busy without exhausting
+        file handles.
+        
+        Args:
+            paths: Files to process.
+            max_concurrency: Maximum number of files processed at once.
+            skip_validation: If True, skip the validation step.
+        
+        Returns:
+            (path, result) tuples in input order, where result is the
+            dictionary returned by BaseParser.process() or the exception
+            raised for that file.
+        
+        Example:
+            >>> dispatcher = Dispatcher()
+            >>> results = asyncio.run(dispatcher.aprocess_many(['a.csv', 'b.csv']))
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(path):
+            async with semaphore:
+                try:
+                    parser = self.get_parser(self.detect_type(path), path)
+                    result = await parser.aprocess(skip_validation)
+                except Exception as e:
+                    return path, e
+            return path, result
+        
+        return list(await asyncio.gather(*(run(path) for path in paths)))
@@ -1,11 +1,18 @@
 """Parsers for different geophysical data types."""
 
-from .elec_parser import ElecParser
-from .seismic_parser import SeismicParser
-from .radar_parser import RadarParser
+from .._lazy import lazy_exports
+
+# Resolved lazily (PEP 562); see src/__init__.py
+_LAZY = {
+    'ElecParser': ('.elec_parser', 'ElecParser'),
+    'SeismicParser': ('.seismic_parser', 'SeismicParser'),
+    'RadarParser': ('.radar_parser', 'RadarParser'),
+}
 
 __all__ = [
     'ElecParser',
     'SeismicParser',
     'RadarParser',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY)
@@ -2,11 +2,11 @@
 
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, Optional
-from io import StringIO
+from typing import Dict, Any, Optional, Iterator, Tuple
 import logging
 
 from ..core.base_parser import BaseParser, ParserError, ValidationError
+from ..config import PARSER_CONFIG
 
 
 class ElecParser(BaseParser):
@@ -28,23 +28,49 @@ class ElecParser(BaseParser):
         >>> df = result['data']
     """
     
+    data_type = 'electrical'
+    
+    # Mapping from source column names to standardized names (matched
+    # case-insensitively, ignoring surrounding whitespace)
+    column_map = {
+        'station': 'station_id',
+        'depth': 'depth_m',
+        'resistance': 'resistivity_ohm_m',
+        'resistivity': 'resistivity_ohm_m',
+        'current': 'current_ma',
+        'voltage': 'voltage_mv',
+    }
+    
+    # Parse-time dtypes; station IDs repeat, so they are stored as categories
+    column_dtypes = {
+        'station_id': 'category',
+        'depth_m': PARSER_CONFIG['electrical']['float_dtype'],
+        'resistivity_ohm_m': PARSER_CONFIG['electrical']['float_dtype'],
+        'current_ma': PARSER_CONFIG['electrical']['float_dtype'],
+        'voltage_mv': PARSER_CONFIG['electrical']['float_dtype'],
+    }
+    
     def load(self) -> None:
         """Load electrical data from file.
         
+        The file is only stat'ed here; parse() reads it directly from disk.
+        
         Raises:
             ParserError: If file cannot be loaded.
         """
         try:
-            with open(self.file_path, 'r', encoding=self.encoding) as f:
-                self._raw_data = f.read()
+            size = self._stat_source()
             self._is_loaded = True
-            self.logger.info(f"Loaded {self.file_path.name} ({len(self._raw_data)} bytes)")
+            self.logger.info("Loaded %s (%d bytes)", self.file_path.name, size)
         except Exception as e:
             raise ParserError(f"Failed to load file: {e}")
     
     def parse(self) -> Dict[str, Any]:
         """Parse electrical resistivity data.
         
+        If the parser was created with a ``chunksize`` parameter, the file is
+        read in chunks through parse_iter() and concatenated.
+        
         Returns:
             Dictionary with 'metadata' and 'data' keys.
         
@@ -54,54 +80,108 @@ class ElecParser(BaseParser):
         if not self.is_loaded:
             raise ParserError("Data must be loaded first. Call load() before parse().")
         
+        chunksize = self._extra_params.get('chunksize')
+        if chunksize:
+            chunks = list(self.parse_iter(chunksize))
+            df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+            df = self._apply_dtypes(df, self.column_dtypes)
+            
+            self._data = df
+            self._is_parsed = True
+            
+            self.logger.info(
+                "Parsed %d records from %s", len(df), self.file_path.name
+            )
+            
+            return {'metadata': self.metadata, 'data': self.data}
+        
         try:
             # Try to read as CSV
-            df = pd.read_csv(StringIO(self._raw_data))
+            df = self._read_csv()
             
-            # Standardize column names (case-insensitive mapping)
-            column_map = {
-                'station': 'station_id',
-                'Station': 'station_id',
-                'STATION': 'station_id',
-                'depth': 'depth_m',
-                'Depth': 'depth_m',
-                'DEPTH': 'depth_m',
-                'depth_m': 'depth_m',
-                'resistance': 'resistivity_ohm_m',
-                'resistivity': 'resistivity_ohm_m',
-                'Resistivity': 'resistivity_ohm_m',
-                'RESISTIVITY': 'resistivity_ohm_m',
-                'current': 'current_ma',
-                'Current': 'current_ma',
-                'voltage': 'voltage_mv',
-                'Voltage': 'voltage_mv',
-            }
-            df = self._standardize_column_names(df, column_map)
+            # Standardize column names
+            df = self._standardize_column_names(df, self.column_map)
             
             # Update metadata
+            ranges = self._column_ranges(df, ['depth_m', 'resistivity_ohm_m'])
             self.metadata.update({
                 'data_type': 'electrical_resistivity',
                 'record_count': len(df),
                 'stations': df['station_id'].nunique() if 'station_id' in df else 0,
-                'depth_range_m': (
-                    df['depth_m'].min(), df['depth_m'].max()
-                ) if 'depth_m' in df else None,
-                'resistivity_range_ohm_m': (
-                    df['resistivity_ohm_m'].min(), df['resistivity_ohm_m'].max()
-                ) if 'resistivity_ohm_m' in df else None,
+                'depth_range_m': ranges.get('depth_m'),
+                'resistivity_range_ohm_m': ranges.get('resistivity_ohm_m'),
             })
             
             self._data = df
             self._is_parsed = True
             
             self.logger.info(
-                f"Parsed {len(df)} records from {self.file_path.name}"
+                "Parsed %d records from %s", len(df), self.file_path.name
             )
             
             return {'metadata': self.metadata, 'data': self.data}
         except Exception as e:
             raise ParserError(f"Failed to parse electrical data: {e}")
     
+    def parse_iter(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Parse electrical data incrementally, yielding standardized chunks.
+        
+        The same summary metadata as parse() is accumulated chunk by chunk
+        and stored once the file has been fully read.
+        
+        Args:
+            chunk_size: Approximate number of rows per chunk
+                (default: APP_CONFIG['chunk_size']).
+        
+        Yields:
+            DataFrames with standardized column names.
+        
+        Raises:
+            ParserError: If reading the file fails.
+        """
+        stations = set()
+        depth_range = None
+        resistivity_range = None
+        
+        for chunk in super().parse_iter(chunk_size):
+            if 'station_id' in chunk:
+                stations.update(chunk['station_id'].dropna().unique())
+            if 'depth_m' in chunk:
+                depth_range = self._merge_range(depth_range, chunk['depth_m'])
+            if 'resistivity_ohm_m' in chunk:
+                resistivity_range = self._merge_range(
+                    resistivity_range, chunk['resistivity_ohm_m']
+                )
+            yield chunk
+        
+        self.metadata.update({
+            'data_type': 'electrical_resistivity',
+            'stations': len(stations),
+            'depth_range_m': depth_range,
+            'resistivity_range_ohm_m': resistivity_range,
+        })
+    
+    @staticmethod
+    def _merge_range(
+        current: Optional[Tuple[Any, Any]],
+        values: pd.Series
+    ) -> Optional[Tuple[Any, Any]]:
+        """Extend a running (min, max) range with a chunk of values.
+        
+        Args:
+            current: Range accumulated so far, or None.
+            values: Values from the next chunk.
+        
+        Returns:
+            Updated (min, max) range.
+        """
+        low, high = values.min(), values.max()
+        if current is None or pd.isna(current[0]):
+            return (low, high)
+        if pd.isna(low):
+            return current
+        return (min(current[0], low), max(current[1], high))
+    
     def validate(self, data: Optional[pd.DataFrame] = None) -> bool:
         """Validate electrical data.
         
@@ -123,6 +203,7 @@ class ElecParser(BaseParser):
         # Check required columns
         required = ['station_id', 'depth_m', 'resistivity_ohm_m']
         self._check_required_columns(data, required)
+        self._check_required_types(data)
         
         # Check value ranges
         range_map = {
@@ -131,15 +212,10 @@ class ElecParser(BaseParser):
             'current_ma': (0, 10000),
             'voltage_mv': (0, 100000),
         }
+        # Also rejects negative depths and non-positive resistivities, since
+        # both lower bounds are above those values
         self._check_value_ranges(data, range_map)
         
-        # Check for negative values in depth and resistivity
-        if (data['depth_m'] < 0).any():
-            raise ValidationError("Depth values cannot be negative")
-        
-        if (data['resistivity_ohm_m'] <= 0).any():
-            raise ValidationError("Resistivity values must be positive")
-        
         self._is_validated = True
         self.logger.info("Validation passed for electrical data")
         return True
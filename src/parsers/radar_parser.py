@@ -28,19 +28,42 @@ class RadarParser(BaseParser):
         >>> df = result['data']
     """
     
+    data_type = 'radar'
+    
+    # Mapping from source column names to standardized names (matched
+    # case-insensitively, ignoring surrounding whitespace)
+    column_map = {
+        'trace': 'trace_number',
+        'sample': 'sample_number',
+        'amp': 'amplitude',
+        'distance': 'distance_m',
+        'time': 'time_ns',
+        'frequency': 'antenna_freq_mhz',
+        'freq': 'antenna_freq_mhz',
+        'antenna_frequency': 'antenna_freq_mhz',
+    }
+    
+    # Parse-time dtypes; trace and sample numbers fit comfortably in int32.
+    # Amplitudes keep their inferred dtype, as they may be integer or float
+    column_dtypes = {
+        'trace_number': 'int32',
+        'sample_number': 'int32',
+    }
+    
     def load(self) -> None:
         """Load GPR data from file.
         
+        The file is only stat'ed here; parse() reads it directly from disk.
+        
         Raises:
             ParserError: If file cannot be loaded.
         """
         try:
             # For binary formats like DZT, we would use specialized libraries
             # For now, support simple CSV format
-            with open(self.file_path, 'r', encoding=self.encoding) as f:
-                self._raw_data = f.read()
+            size = self._stat_source()
             self._is_loaded = True
-            self.logger.info(f"Loaded {self.file_path.name} ({len(self._raw_data)} bytes)")
+            self.logger.info("Loaded %s (%d bytes)", self.file_path.name, size)
         except Exception as e:
             raise ParserError(f"Failed to load GPR file: {e}")
     
@@ -58,49 +81,27 @@ class RadarParser(BaseParser):
         
         try:
             # Parse CSV format (simplified for now)
-            df = pd.read_csv(pd.io.common.StringIO(self._raw_data))
+            df = self._read_csv()
             
             # Standardize column names
-            column_map = {
-                'trace': 'trace_number',
-                'Trace': 'trace_number',
-                'TRACE': 'trace_number',
-                'sample': 'sample_number',
-                'Sample': 'sample_number',
-                'SAMPLE': 'sample_number',
-                'amp': 'amplitude',
-                'Amplitude': 'amplitude',
-                'AMPLITUDE': 'amplitude',
-                'distance': 'distance_m',
-                'Distance': 'distance_m',
-                'time': 'time_ns',
-                'Time': 'time_ns',
-                'time_ns': 'time_ns',
-                'frequency': 'antenna_freq_mhz',
-                'freq': 'antenna_freq_mhz',
-                'antenna_frequency': 'antenna_freq_mhz',
-            }
-            df = self._standardize_column_names(df, column_map)
+            df = self._standardize_column_names(df, self.column_map)
             
             # Update metadata
+            ranges = self._column_ranges(df, ['amplitude', 'distance_m'])
             self.metadata.update({
                 'data_type': 'radar',
                 'record_count': len(df),
                 'traces': df['trace_number'].nunique() if 'trace_number' in df else 0,
                 'samples_per_trace': df['sample_number'].nunique() if 'sample_number' in df else 0,
-                'amplitude_range': (
-                    df['amplitude'].min(), df['amplitude'].max()
-                ) if 'amplitude' in df else None,
-                'distance_range_m': (
-                    df['distance_m'].min(), df['distance_m'].max()
-                ) if 'distance_m' in df else None,
+                'amplitude_range': ranges.get('amplitude'),
+                'distance_range_m': ranges.get('distance_m'),
             })
             
             self._data = df
             self._is_parsed = True
             
             self.logger.info(
-                f"Parsed {len(df)} records from {self.file_path.name}"
+                "Parsed %d records from %s", len(df), self.file_path.name
             )
             
             return {'metadata': self.metadata, 'data': self.data}
@@ -128,6 +129,7 @@ class RadarParser(BaseParser):
         # Check required columns
         required = ['trace_number', 'sample_number', 'amplitude']
         self._check_required_columns(data, required)
+        self._check_required_types(data)
         
         # Check value ranges
         range_map = {
@@ -137,12 +139,9 @@ class RadarParser(BaseParser):
             'time_ns': (0, 1000000),
             'antenna_freq_mhz': (10, 5000),
         }
+        # Also rejects negative sample numbers, since the lower bound is 0
         self._check_value_ranges(data, range_map)
         
-        # Check for negative sample numbers
-        if (data['sample_number'] < 0).any():
-            raise ValidationError("Sample numbers cannot be negative")
-        
         self._is_validated = True
         self.logger.info("Validation passed for GPR data")
         return True
@@ -27,19 +27,37 @@ class SeismicParser(BaseParser):
         >>> df = result['data']
     """
     
+    data_type = 'seismic'
+    
+    # Mapping from source column names to standardized names (matched
+    # case-insensitively, ignoring surrounding whitespace)
+    column_map = {
+        'trace': 'trace_number',
+        'time': 'time_ms',
+        'amp': 'amplitude',
+        'station': 'station_id',
+        'offset': 'offset_m',
+    }
+    
+    # Parse-time dtypes; trace numbers fit comfortably in int32
+    column_dtypes = {
+        'trace_number': 'int32',
+    }
+    
     def load(self) -> None:
         """Load seismic data from file.
         
+        The file is only stat'ed here; parse() reads it directly from disk.
+        
         Raises:
             ParserError: If file cannot be loaded.
         """
         try:
             # For SEG-Y files, we would use a specialized library like segyio
             # For now, support simple CSV format
-            with open(self.file_path, 'r', encoding=self.encoding) as f:
-                self._raw_data = f.read()
+            size = self._stat_source()
             self._is_loaded = True
-            self.logger.info(f"Loaded {self.file_path.name} ({len(self._raw_data)} bytes)")
+            self.logger.info("Loaded %s (%d bytes)", self.file_path.name, size)
         except Exception as e:
             raise ParserError(f"Failed to load seismic file: {e}")
     
@@ -57,45 +75,26 @@ class SeismicParser(BaseParser):
         
         try:
             # Parse CSV format (simplified for now)
-            df = pd.read_csv(pd.io.common.StringIO(self._raw_data))
+            df = self._read_csv()
             
             # Standardize column names
-            column_map = {
-                'trace': 'trace_number',
-                'Trace': 'trace_number',
-                'TRACE': 'trace_number',
-                'time': 'time_ms',
-                'Time': 'time_ms',
-                'TIME': 'time_ms',
-                'time_ms': 'time_ms',
-                'amp': 'amplitude',
-                'Amplitude': 'amplitude',
-                'AMPLITUDE': 'amplitude',
-                'station': 'station_id',
-                'Station': 'station_id',
-                'offset': 'offset_m',
-                'Offset': 'offset_m',
-            }
-            df = self._standardize_column_names(df, column_map)
+            df = self._standardize_column_names(df, self.column_map)
             
             # Update metadata
+            ranges = self._column_ranges(df, ['time_ms', 'amplitude'])
             self.metadata.update({
                 'data_type': 'seismic',
                 'record_count': len(df),
                 'traces': df['trace_number'].nunique() if 'trace_number' in df else 0,
-                'time_range_ms': (
-                    df['time_ms'].min(), df['time_ms'].max()
-                ) if 'time_ms' in df else None,
-                'amplitude_range': (
-                    df['amplitude'].min(), df['amplitude'].max()
-                ) if 'amplitude' in df else None,
+                'time_range_ms': ranges.get('time_ms'),
+                'amplitude_range': ranges.get('amplitude'),
             })
             
             self._data = df
             self._is_parsed = True
             
             self.logger.info(
-                f"Parsed {len(df)} records from {self.file_path.name}"
+                "Parsed %d records from %s", len(df), self.file_path.name
             )
             
             return {'metadata': self.metadata, 'data': self.data}
@@ -123,6 +122,7 @@ class SeismicParser(BaseParser):
         # Check required columns
         required = ['trace_number', 'time_ms', 'amplitude']
         self._check_required_columns(data, required)
+        self._check_required_types(data)
         
         # Check value ranges
         range_map = {
@@ -130,12 +130,9 @@ class SeismicParser(BaseParser):
             'amplitude': (-1e6, 1e6),
             'offset_m': (0, 100000),
         }
+        # Also rejects negative time values, since the lower bound is 0
         self._check_value_ranges(data, range_map)
         
-        # Check for negative time values
-        if (data['time_ms'] < 0).any():
-            raise ValidationError("Time values cannot be negative")
-        
         self._is_validated = True
         self.logger.info("Validation passed for seismic data")
         return True
@@ -0,0 +1,128 @@
+"""Numeric kernels for quality control checks.
+
+Arrays of at least JIT_MIN_SIZE values are handled by numba-compiled
+loops (when numba is installed) that count fence or range violations
+directly instead of building a boolean mask for them; the IQR kernel still
+copies the finite values to compute the quartiles. Smaller arrays, or all
+arrays without numba, use equivalent vectorized numpy code.
+"""
+
+import warnings
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba is optional
+    HAS_NUMBA = False
+
+
+# Arrays smaller than this are handled by numpy: for them the one-off JIT
+# compilation (or cache load) costs more than the fused kernel saves.
+JIT_MIN_SIZE = 1_000_000
+
+
+def iqr_outlier_count(arr: np.ndarray, multiplier: float) -> int:
+    """Count values outside the IQR fences of an array.
+    
+    NaN values are ignored.
+    
+    Args:
+        arr: 1-D float64 array.
+        multiplier: IQR multiplier for the lower and upper fences.
+    
+    Returns:
+        Number of values below Q1 - multiplier*IQR or above Q3 + multiplier*IQR.
+    """
+    if HAS_NUMBA and arr.size >= JIT_MIN_SIZE:
+        return int(_iqr_outlier_count_jit(arr, multiplier))
+    
+    finite = arr[~np.isnan(arr)]
+    if finite.size == 0:
+        return 0
+    q1, q3 = np.percentile(finite, [25, 75])
+    iqr = q3 - q1
+    lower_bound = q1 - multiplier * iqr
+    upper_bound = q3 + multiplier * iqr
+    return int(np.count_nonzero((finite < lower_bound) | (finite > upper_bound)))
+
+
+def iqr_outlier_counts(block: np.ndarray, multiplier: float) -> np.ndarray:
+    """Count values outside the IQR fences of each column of a 2-D array.
+    
+    The quartiles of all columns come from one batched np.nanquantile call
+    and the fences are applied as a single broadcast mask, rather than a
+    Python loop of per-column percentile calls. Columns long enough for the
+    JIT kernel are handed to iqr_outlier_count() instead. NaN values are
+    ignored.
+    
+    Args:
+        block: 2-D float64 array, one column per variable.
+        multiplier: IQR multiplier for the lower and upper fences.
+    
+    Returns:
+        1-D int64 array with the outlier count of each column.
+    """
+    if block.size == 0:
+        return np.zeros(block.shape[1], dtype=np.int64)
+    
+    if HAS_NUMBA and block.shape[0] >= JIT_MIN_SIZE:
+        return np.array(
+            [iqr_outlier_count(np.ascontiguousarray(block[:, i]), multiplier)
+             for i in range(block.shape[1])],
+            dtype=np.int64,
+        )
+    
+    with warnings.catch_warnings():
+        # All-NaN columns get NaN fences, which flag nothing
+        warnings.simplefilter('ignore', RuntimeWarning)
+        q1, q3 = np.nanquantile(block, [0.25, 0.75], axis=0)
+    iqr = q3 - q1
+    lower_bound = q1 - multiplier * iqr
+    upper_bound = q3 + multiplier * iqr
+    return np.count_nonzero((block < lower_bound) | (block > upper_bound), axis=0)
+
+
+def range_violation_count(arr: np.ndarray, min_val: float, max_val: float) -> int:
+    """Count values outside the closed interval [min_val, max_val].
+    
+    NaN values are ignored.
+    
+    Args:
+        arr: 1-D float64 array.
+        min_val: Lower bound.
+        max_val: Upper bound.
+    
+    Returns:
+        Number of values below min_val or above max_val.
+    """
+    if HAS_NUMBA and arr.size >= JIT_MIN_SIZE:
+        return int(_range_violation_count_jit(arr, min_val, max_val))
+    
+    return int(np.count_nonzero((arr < min_val) | (arr > max_val)))
+
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _iqr_outlier_count_jit(arr, multiplier):
+        finite = arr[~np.isnan(arr)]
+        if finite.size == 0:
+            return 0
+        quartiles = np.percentile(finite, np.array([25.0, 75.0]))
+        iqr = quartiles[1] - quartiles[0]
+        lower_bound = quartiles[0] - multiplier * iqr
+        upper_bound = quartiles[1] + multiplier * iqr
+        count = 0
+        for i in prange(finite.size):
+            if finite[i] < lower_bound or finite[i] > upper_bound:
+                count += 1
+        return count
+    
+    @njit(cache=True, parallel=True)
+    def _range_violation_count_jit(arr, min_val, max_val):
+        count = 0
+        for i in prange(arr.size):
+            if arr[i] < min_val or arr[i] > max_val:
+                count += 1
+        return count
@@ -1,10 +1,53 @@
 """Quality control checker for geophysical data."""
 
 import pandas as pd
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 import logging
+import os
+import threading
 import numpy as np
 
+from ..config import QC_CONFIG, PARSER_CONFIG
+from ._qc_kernels import HAS_NUMBA, JIT_MIN_SIZE, iqr_outlier_counts, range_violation_count
+
+
+# Number of non-null values parsed to rule out numeric-looking text columns
+_NUMERIC_PROBE_SIZE = 1024
+
+# Numeric blocks with at least this many values have their columns split
+# across a thread pool; numpy releases the GIL in the reductions
+_PARALLEL_MIN_SIZE = 1_000_000
+
+# Thread pool shared by all checkers; created on first use by _get_executor()
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the module-wide thread pool for column-group reductions."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count(), thread_name_prefix='qc'
+            )
+        return _executor
+
+
+def _is_constant(block: np.ndarray) -> np.ndarray:
+    """Flag columns with at least two values that are all identical.
+    
+    Args:
+        block: 2-D float64 array, one column per variable.
+    
+    Returns:
+        1-D boolean array, one value per column. NaN values are ignored.
+    """
+    counts = np.count_nonzero(~np.isnan(block), axis=0)
+    constant = np.fmin.reduce(block, axis=0) == np.fmax.reduce(block, axis=0)
+    return constant & (counts > 1)
+
 
 class QCChecker:
     """Performs quality control checks on geophysical data.
@@ -26,11 +69,21 @@ class QCChecker:
         """Initialize the QC checker."""
         self.logger = logging.getLogger(__name__)
     
-    def check(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+    def check(
+        self,
+        parsed_data: Dict[str, Any],
+        data_type: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Run QC checks on parsed data.
         
+        Checks are enabled or disabled through
+        ``QC_CONFIG['validation_rules']``.
+        
         Args:
             parsed_data: Dictionary with 'metadata' and 'data' keys.
+            data_type: Type of geophysical data. When given, values are also
+                checked against ``PARSER_CONFIG[data_type]['value_ranges']``
+                and the data is checked against the parser schema.
         
         Returns:
             Dictionary with QC results:
@@ -38,45 +91,85 @@ class QCChecker:
                 - issues: List of issue descriptions
                 - warnings: List of warning messages
                 - checks_run: List of check names that were executed
+                - schema_valid: Whether the data passes the same checks as
+                  the parser's validate(), or None if they were not run
+                - schema_errors: List of schema and range violations
         """
         df = parsed_data['data']
         issues = []
         warnings = []
         checks_run = []
+        schema_errors = []
+        
+        rules = QC_CONFIG['validation_rules']
+        
+        # Check required columns and their types
+        if rules['check_schema'] and data_type is not None:
+            schema_result = self._check_schema(df, data_type)
+            checks_run.append('schema')
+            if schema_result['has_issues']:
+                issues.append(schema_result['message'])
+                schema_errors.append(schema_result['message'])
         
         # Check for missing values
-        missing_result = self._check_missing_values(df)
-        checks_run.append('missing_values')
-        if missing_result['has_issues']:
-            issues.append(missing_result['message'])
-        elif missing_result.get('has_warnings'):
-            warnings.append(missing_result['message'])
+        if rules['check_missing']:
+            missing_result = self._check_missing_values(df)
+            checks_run.append('missing_values')
+            if missing_result['has_issues']:
+                issues.append(missing_result['message'])
+            elif missing_result.get('has_warnings'):
+                warnings.append(missing_result['message'])
         
         # Check for duplicates
-        duplicate_result = self._check_duplicates(df)
-        checks_run.append('duplicates')
-        if duplicate_result['has_issues']:
-            issues.append(duplicate_result['message'])
+        if rules['check_duplicates']:
+            duplicate_result = self._check_duplicates(df)
+            checks_run.append('duplicates')
+            if duplicate_result['has_issues']:
+                issues.append(duplicate_result['message'])
+        
+        # The outlier and consistency checks share one float64 copy of the
+        # numeric columns
+        numeric = None
+        if rules['check_outliers'] or rules['check_dtypes']:
+            numeric = self._numeric_block(df)
         
         # Check for outliers
-        outlier_result = self._check_outliers(df)
-        checks_run.append('outliers')
-        if outlier_result['has_warnings']:
-            warnings.append(outlier_result['message'])
+        if rules['check_outliers']:
+            outlier_result = self._check_outliers(df, numeric)
+            checks_run.append('outliers')
+            if outlier_result['has_warnings']:
+                warnings.append(outlier_result['message'])
         
         # Check data consistency
-        consistency_result = self._check_consistency(df)
-        checks_run.append('consistency')
-        if consistency_result['has_warnings']:
-            warnings.append(consistency_result['message'])
+        if rules['check_dtypes']:
+            consistency_result = self._check_consistency(df, numeric)
+            checks_run.append('consistency')
+            if consistency_result['has_warnings']:
+                warnings.append(consistency_result['message'])
+        
+        # Check configured value ranges
+        if rules['check_ranges'] and data_type is not None:
+            range_result = self._check_ranges(df, data_type)
+            checks_run.append('ranges')
+            if range_result['has_issues']:
+                issues.append(range_result['message'])
+                schema_errors.append(range_result['message'])
         
         passed = len(issues) == 0
         
+        # The schema is fully checked only when both schema and range checks ran
+        if 'schema' in checks_run and 'ranges' in checks_run:
+            schema_valid = len(schema_errors) == 0
+        else:
+            schema_valid = None
+        
         result = {
             'passed': passed,
             'issues': issues,
             'warnings': warnings,
             'checks_run': checks_run,
+            'schema_valid': schema_valid,
+            'schema_errors': schema_errors,
             'summary': {
                 'total_records': len(df),
                 'total_columns': len(df.columns),
@@ -88,7 +181,7 @@ class QCChecker:
         if passed:
             self.logger.info("All QC checks passed")
         else:
-            self.logger.warning(f"QC checks failed with {len(issues)} issues")
+            self.logger.warning("QC checks failed with %d issues", len(issues))
         
         return result
     
@@ -115,7 +208,7 @@ class QCChecker:
             )
             
             # Determine if it's an issue or warning based on threshold
-            if missing_pct > 10:  # More than 10% missing
+            if missing_pct > QC_CONFIG['missing_value_threshold'] * 100:
                 return {'has_issues': True, 'message': message}
             else:
                 return {'has_issues': False, 'has_warnings': True, 'message': message}
@@ -140,39 +233,103 @@ class QCChecker:
             )
             
             # Determine if it's an issue based on threshold
-            if dup_pct > 5:  # More than 5% duplicates
+            if dup_pct > QC_CONFIG['duplicate_threshold'] * 100:
                 return {'has_issues': True, 'message': message}
             else:
                 return {'has_issues': False, 'has_warnings': True, 'message': message}
         
         return {'has_issues': False, 'message': 'No duplicates found'}
     
-    def _check_outliers(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Check for outliers in numeric columns using IQR method.
+    @staticmethod
+    def _numeric_block(df: pd.DataFrame) -> Tuple[pd.Index, np.ndarray]:
+        """Get the numeric columns of a frame as one 2-D float64 array.
+        
+        Args:
+            df: DataFrame to convert.
+        
+        Returns:
+            Tuple of (numeric column names, array with one column each).
+        """
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        block = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        return numeric_cols, block
+    
+    def _map_column_groups(self, func, block: np.ndarray) -> np.ndarray:
+        """Apply a per-column reduction to a 2-D array, in parallel if large.
+        
+        Large blocks on multi-core machines are split into column groups that
+        run on a thread pool shared by all checkers. Blocks long enough for
+        the (already multithreaded) JIT kernels are left to them.
+        
+        Args:
+            func: Function mapping a 2-D array to a 1-D array with one value
+                per column.
+            block: 2-D array, one column per variable.
+        
+        Returns:
+            Concatenated 1-D result, one value per column of block.
+        """
+        workers = min(os.cpu_count() or 1, block.shape[1])
+        if (
+            workers < 2
+            or block.size < _PARALLEL_MIN_SIZE
+            or (HAS_NUMBA and block.shape[0] >= JIT_MIN_SIZE)
+        ):
+            return func(block)
+        
+        groups = np.array_split(np.arange(block.shape[1]), workers)
+        return np.concatenate(list(_get_executor().map(
+            lambda cols: func(block[:, cols[0]:cols[-1] + 1]), groups
+        )))
+    
+    def _check_outliers(
+        self,
+        df: pd.DataFrame,
+        numeric: Optional[Tuple[pd.Index, np.ndarray]] = None
+    ) -> Dict[str, Any]:
+        """Check for outliers in numeric columns.
+        
+        Uses the IQR or z-score method configured in
+        ``QC_CONFIG['outlier_detection']``. IQR fences for all numeric
+        columns are computed together over one 2-D array; z-scores are
+        computed per column with vectorized numpy operations.
         
         Args:
             df: DataFrame to check.
+            numeric: Result of _numeric_block(df), if already computed.
         
         Returns:
             Dictionary with check results.
         """
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        settings = QC_CONFIG['outlier_detection']
+        numeric_cols, block = numeric if numeric is not None else self._numeric_block(df)
         outlier_info = {}
         
-        for col in numeric_cols:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            outliers = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
-            
+        if settings['method'] == 'zscore':
+            counts = {}
+            for i, col in enumerate(numeric_cols):
+                arr = block[:, i]
+                arr = arr[~np.isnan(arr)]
+                std = arr.std(ddof=1) if arr.size > 1 else 0.0
+                if std == 0:
+                    continue
+                zscores = np.abs(arr - arr.mean()) / std
+                counts[col] = int(np.count_nonzero(zscores > settings['zscore_threshold']))
+        else:
+            # All columns' quartiles and fences in one batched pass
+            counts = dict(zip(
+                numeric_cols,
+                self._map_column_groups(
+                    lambda part: iqr_outlier_counts(part, settings['iqr_multiplier']),
+                    block
+                ).tolist()
+            ))
+        
+        for col, outliers in counts.items():
             if outliers > 0:
                 outlier_pct = (outliers / len(df)) * 100
                 outlier_info[col] = {
-                    'count': int(outliers),
+                    'count': outliers,
                     'percentage': round(outlier_pct, 2)
                 }
         
@@ -182,29 +339,98 @@ class QCChecker:
         
         return {'has_warnings': False, 'message': 'No outliers detected'}
     
-    def _check_consistency(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _check_schema(self, df: pd.DataFrame, data_type: str) -> Dict[str, Any]:
+        """Check that required columns exist and non-string ones are numeric.
+        
+        Args:
+            df: DataFrame to check.
+            data_type: Type of geophysical data.
+        
+        Returns:
+            Dictionary with check results.
+        """
+        config = PARSER_CONFIG.get(data_type, {})
+        required = config.get('required_columns', ())
+        string_columns = config.get('string_columns', ())
+        
+        missing = [col for col in required if col not in df.columns]
+        if missing:
+            message = f"Missing required columns: {', '.join(missing)}"
+            return {'has_issues': True, 'message': message}
+        
+        dtypes = df.dtypes
+        non_numeric = [
+            col for col in required
+            if col not in string_columns and not pd.api.types.is_numeric_dtype(dtypes[col])
+        ]
+        if non_numeric:
+            message = f"Required columns must be numeric: {', '.join(non_numeric)}"
+            return {'has_issues': True, 'message': message}
+        
+        return {'has_issues': False, 'message': 'Schema is valid'}
+    
+    def _check_ranges(self, df: pd.DataFrame, data_type: str) -> Dict[str, Any]:
+        """Check numeric columns against the configured value ranges.
+        
+        Args:
+            df: DataFrame to check.
+            data_type: Type of geophysical data.
+        
+        Returns:
+            Dictionary with check results.
+        """
+        value_ranges = PARSER_CONFIG.get(data_type, {}).get('value_ranges', {})
+        violations = {}
+        
+        for col, (min_val, max_val) in value_ranges.items():
+            if col not in df.columns or not pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            
+            arr = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            out_of_range = range_violation_count(arr, min_val, max_val)
+            if out_of_range > 0:
+                violations[col] = out_of_range
+        
+        if violations:
+            message = f"Values out of configured range: {violations}"
+            return {'has_issues': True, 'message': message}
+        
+        return {'has_issues': False, 'message': 'All values within configured ranges'}
+    
+    def _check_consistency(
+        self,
+        df: pd.DataFrame,
+        numeric: Optional[Tuple[pd.Index, np.ndarray]] = None
+    ) -> Dict[str, Any]:
         """Check for data consistency issues.
         
         Args:
             df: DataFrame to check.
+            numeric: Result of _numeric_block(df), if already computed.
         
         Returns:
             Dictionary with check results.
         """
         warnings = []
         
-        # Check if numeric columns have reasonable variance
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        # Check if numeric columns have reasonable variance: a column with at
+        # least two values has zero variance when its min equals its max
+        numeric_cols, block = numeric if numeric is not None else self._numeric_block(df)
         
-        for col in numeric_cols:
-            if df[col].std() == 0:
+        if block.size:
+            constant = self._map_column_groups(_is_constant, block)
+            for col in numeric_cols[constant]:
                 warnings.append(f"Column '{col}' has zero variance (all values are identical)")
         
         # Check for unexpected data types
         for col in df.columns:
             if df[col].dtype == 'object':
-                # Check if it could be numeric
+                # Check if it could be numeric. Most text columns already fail
+                # on a small sample, so the whole column is only parsed when
+                # the sample converts cleanly
+                sample = df[col].dropna().head(_NUMERIC_PROBE_SIZE)
                 try:
+                    pd.to_numeric(sample)
                     pd.to_numeric(df[col])
                     warnings.append(f"Column '{col}' is stored as object but appears to be numeric")
                 except (ValueError, TypeError):
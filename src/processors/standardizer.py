@@ -1,11 +1,67 @@
 """Data standardization processor."""
 
 import pandas as pd
+import numpy as np
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, Union, Iterable, Optional
 import logging
+import json
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+    pq = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+from ..config import OUTPUT_CONFIG
+
+
+# Column types enforced per data type: 'numeric' columns are coerced with
+# pd.to_numeric (invalid values become NaN), 'str' columns with astype(str)
+_SCHEMAS = {
+    'electrical': {
+        'station_id': 'str',
+        'depth_m': 'numeric',
+        'resistivity_ohm_m': 'numeric',
+    },
+    'seismic': {
+        'trace_number': 'numeric',
+        'time_ms': 'numeric',
+        'amplitude': 'numeric',
+    },
+    'radar': {
+        'trace_number': 'numeric',
+        'sample_number': 'numeric',
+        'amplitude': 'numeric',
+    },
+}
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy values the JSON encoders do not handle natively.
+    
+    Args:
+        obj: Value the encoder could not serialize.
+    
+    Returns:
+        Equivalent native Python value.
+    
+    Raises:
+        TypeError: If the value is not a numpy scalar or array.
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class Standardizer:
     """Standardizes geophysical data to common format.
@@ -23,6 +79,11 @@ class Standardizer:
         >>> standardizer.write_output(result, 'output.csv')
     """
     
+    __slots__ = ('output_format', 'logger')
+    
+    # Supported output formats
+    _supported_formats = ('csv', 'json', 'excel', 'parquet')
+    
     def __init__(self, output_format: str = 'csv'):
         """Initialize the standardizer.
         
@@ -32,9 +93,6 @@ class Standardizer:
         self.output_format = output_format
         self.logger = logging.getLogger(__name__)
         
-        # Supported output formats
-        self._supported_formats = ['csv', 'json', 'excel', 'parquet']
-        
         if output_format not in self._supported_formats:
             raise ValueError(
                 f"Unsupported output format: {output_format}. "
@@ -48,6 +106,11 @@ class Standardizer:
     ) -> Dict[str, Any]:
         """Standardize parsed data to common format.
         
+        The input frame is never modified, but it is not copied either:
+        columns that need no conversion are shared with the returned frame,
+        so in-place edits to one (e.g. ``df.loc[...] = ...``) may show up in
+        the other unless pandas copy-on-write is enabled.
+        
         Args:
             parsed_data: Dictionary with 'metadata' and 'data' keys.
             data_type: Type of geophysical data.
@@ -55,7 +118,9 @@ class Standardizer:
         Returns:
             Dictionary with standardized 'metadata' and 'data'.
         """
-        df = parsed_data['data'].copy()
+        # Column assignments below replace whole columns rather than writing
+        # into the parsed arrays, so a shallow copy keeps the input intact
+        df = parsed_data['data'].copy(deep=False)
         metadata = parsed_data['metadata'].copy()
         
         # Add standardization metadata
@@ -63,43 +128,30 @@ class Standardizer:
         metadata['standardization_version'] = '1.0'
         metadata['data_type'] = data_type
         
-        # Apply common standardizations
-        df = self._apply_common_standards(df)
-        
-        # Apply data type specific standardizations
-        if data_type == 'electrical':
-            df = self._standardize_electrical(df)
-        elif data_type == 'seismic':
-            df = self._standardize_seismic(df)
-        elif data_type == 'radar':
-            df = self._standardize_radar(df)
+        df = self._standardize_frame(df, data_type)
         
-        self.logger.info(f"Standardized {len(df)} records for {data_type} data")
+        self.logger.info("Standardized %d records for %s data", len(df), data_type)
         
         return {'metadata': metadata, 'data': df}
     
-    def _apply_common_standards(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply common standardizations to all data types.
+    def _standardize_frame(self, df: pd.DataFrame, data_type: str) -> pd.DataFrame:
+        """Apply common and data type specific standardizations to a frame.
         
         Args:
             df: DataFrame to standardize.
+            data_type: Type of geophysical data.
         
         Returns:
             Standardized DataFrame.
         """
-        # Sort columns alphabetically
-        df = df.reindex(sorted(df.columns), axis=1)
-        
-        # Remove any completely empty rows
-        df = df.dropna(how='all')
-        
-        # Reset index
-        df = df.reset_index(drop=True)
+        # Apply common standardizations
+        df = self._apply_common_standards(df)
         
-        return df
+        # Apply data type specific standardizations
+        return self._apply_schema(df, data_type)
     
-    def _standardize_electrical(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply electrical data specific standardizations.
+    def _apply_common_standards(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply common standardizations to all data types.
         
         Args:
             df: DataFrame to standardize.
@@ -107,59 +159,51 @@ class Standardizer:
         Returns:
             Standardized DataFrame.
         """
-        # Ensure proper data types
-        if 'station_id' in df.columns:
-            df['station_id'] = df['station_id'].astype(str)
+        # Each step is skipped when it would not change the frame, as each
+        # one otherwise copies every column
         
-        if 'depth_m' in df.columns:
-            df['depth_m'] = pd.to_numeric(df['depth_m'], errors='coerce')
+        # Sort columns alphabetically
+        columns = sorted(df.columns)
+        if columns != list(df.columns):
+            df = df.reindex(columns, axis=1)
+        
+        # Remove any completely empty rows. A row can only be empty if every
+        # column has missing values, which is checked column by column
+        # (stopping at the first complete one) before building a row mask
+        if all(df[col].hasnans for col in df.columns):
+            empty = df.isna().all(axis=1).to_numpy()
+            if empty.any():
+                df = df.loc[~empty]
         
-        if 'resistivity_ohm_m' in df.columns:
-            df['resistivity_ohm_m'] = pd.to_numeric(df['resistivity_ohm_m'], errors='coerce')
+        # Reset index
+        if not df.index.equals(pd.RangeIndex(len(df))):
+            df = df.reset_index(drop=True)
         
         return df
     
-    def _standardize_seismic(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply seismic data specific standardizations.
-        
-        Args:
-            df: DataFrame to standardize.
-        
-        Returns:
-            Standardized DataFrame.
-        """
-        # Ensure proper data types
-        if 'trace_number' in df.columns:
-            df['trace_number'] = pd.to_numeric(df['trace_number'], errors='coerce')
-        
-        if 'time_ms' in df.columns:
-            df['time_ms'] = pd.to_numeric(df['time_ms'], errors='coerce')
+    def _apply_schema(self, df: pd.DataFrame, data_type: str) -> pd.DataFrame:
+        """Coerce columns to the types in _SCHEMAS for the data type.
         
-        if 'amplitude' in df.columns:
-            df['amplitude'] = pd.to_numeric(df['amplitude'], errors='coerce')
-        
-        return df
-    
-    def _standardize_radar(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply radar data specific standardizations.
+        Numeric columns that were already parsed as numbers are left as they
+        are; the remaining conversions are assigned to the frame in one call.
         
         Args:
             df: DataFrame to standardize.
+            data_type: Type of geophysical data.
         
         Returns:
             Standardized DataFrame.
         """
-        # Ensure proper data types
-        if 'trace_number' in df.columns:
-            df['trace_number'] = pd.to_numeric(df['trace_number'], errors='coerce')
-        
-        if 'sample_number' in df.columns:
-            df['sample_number'] = pd.to_numeric(df['sample_number'], errors='coerce')
-        
-        if 'amplitude' in df.columns:
-            df['amplitude'] = pd.to_numeric(df['amplitude'], errors='coerce')
-        
-        return df
+        updates = {}
+        for column, kind in _SCHEMAS.get(data_type, {}).items():
+            if column not in df.columns:
+                continue
+            if kind == 'str':
+                updates[column] = df[column].astype(str)
+            elif not pd.api.types.is_numeric_dtype(df[column]):
+                updates[column] = pd.to_numeric(df[column], errors='coerce')
+        
+        return df.assign(**updates) if updates else df
     
     def write_output(
         self,
@@ -187,32 +231,197 @@ class Standardizer:
         elif self.output_format == 'excel':
             df.to_excel(output_path, index=False)
         elif self.output_format == 'parquet':
-            df.to_parquet(output_path, index=False)
-        
-        self.logger.info(f"Wrote output to {output_path}")
+            if pq is not None:
+                # Write the Arrow table directly rather than through
+                # DataFrame.to_parquet()
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pq.write_table(
+                    table, output_path, use_dictionary=True, **self._parquet_options()
+                )
+            else:
+                df.to_parquet(output_path, index=False, **self._parquet_options())
+        
+        self.logger.info("Wrote output to %s", output_path)
         
         # Write metadata file if requested
         if include_metadata and data.get('metadata'):
-            metadata_path = output_path.parent / f"{output_path.stem}_metadata.json"
-            import json
-            import numpy as np
-            
-            # Convert numpy types to native Python types for JSON serialization
-            def convert_numpy_types(obj):
-                if isinstance(obj, np.integer):
-                    return int(obj)
-                elif isinstance(obj, np.floating):
-                    return float(obj)
-                elif isinstance(obj, np.ndarray):
-                    return obj.tolist()
-                elif isinstance(obj, dict):
-                    return {k: convert_numpy_types(v) for k, v in obj.items()}
-                elif isinstance(obj, (list, tuple)):
-                    return [convert_numpy_types(item) for item in obj]
-                return obj
-            
-            metadata_json = convert_numpy_types(data['metadata'])
-            
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata_json, f, indent=2)
-            self.logger.info(f"Wrote metadata to {metadata_path}")
+            self._write_metadata(data['metadata'], output_path)
+    
+    def write_stream(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        data_type: str,
+        output_path: Union[str, Path],
+        metadata: Optional[Dict[str, Any]] = None,
+        column_dtypes: Optional[Dict[str, str]] = None
+    ) -> int:
+        """Standardize and write data chunk by chunk.
+        
+        Each chunk is standardized and appended to the output as soon as it
+        is produced, so memory use is bounded by the chunk size. Only CSV and
+        Parquet output support appending. Parquet needs one schema for every
+        chunk, so it is built from ``column_dtypes`` and the data type's
+        schema rather than from whatever the first chunk happened to infer
+        (see _stream_schema()).
+        
+        Args:
+            chunks: Iterable of parsed DataFrames (e.g. from parser.parse_iter()).
+            data_type: Type of geophysical data.
+            output_path: Path where to save the output.
+            metadata: Optional metadata to write to the sidecar file once all
+                chunks have been written.
+            column_dtypes: Declared dtypes of the parser that produced the
+                chunks (its ``column_dtypes`` attribute).
+        
+        Returns:
+            Number of records written.
+        
+        Raises:
+            ValueError: If the output format does not support streaming.
+        """
+        if self.output_format not in ('csv', 'parquet'):
+            raise ValueError(
+                f"Streaming output is not supported for format: {self.output_format}"
+            )
+        if self.output_format == 'parquet' and pq is None:
+            raise ValueError("Streaming parquet output requires pyarrow")
+        
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        record_count = 0
+        writer = None
+        try:
+            for chunk in chunks:
+                df = self._standardize_frame(chunk, data_type)
+                
+                if self.output_format == 'csv':
+                    df.to_csv(
+                        output_path,
+                        index=False,
+                        mode='w' if record_count == 0 else 'a',
+                        header=record_count == 0,
+                    )
+                else:
+                    if writer is None:
+                        writer = pq.ParquetWriter(
+                            output_path,
+                            self._stream_schema(df, data_type, column_dtypes or {}),
+                            **self._parquet_options()
+                        )
+                    table = pa.Table.from_pandas(
+                        df, schema=writer.schema, preserve_index=False
+                    )
+                    writer.write_table(table)
+                
+                record_count += len(df)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        self.logger.info("Streamed %d records to %s", record_count, output_path)
+        
+        if metadata:
+            metadata = dict(metadata)
+            metadata['standardized_at'] = datetime.now().isoformat()
+            metadata['standardization_version'] = '1.0'
+            metadata['data_type'] = data_type
+            metadata['record_count'] = record_count
+            self._write_metadata(metadata, output_path)
+        
+        return record_count
+    
+    @staticmethod
+    def _stream_schema(
+        df: pd.DataFrame,
+        data_type: str,
+        column_dtypes: Dict[str, str]
+    ) -> 'pa.Schema':
+        """Build a parquet schema that every chunk of a stream can be cast to.
+        
+        Types inferred from one chunk do not hold for the next: a declared
+        int32 column stays int64 when a chunk overflows it, an all-missing
+        column infers as null, and an integer-looking column may hold floats
+        further down. Declared integer columns are therefore written as
+        int64, other declared dtypes as declared, remaining numeric columns
+        as float64 and text, category and all-missing columns as strings.
+        
+        Args:
+            df: First standardized chunk.
+            data_type: Type of geophysical data.
+            column_dtypes: Declared parser dtypes by column name.
+        
+        Returns:
+            Arrow schema for the output file.
+        """
+        kinds = _SCHEMAS.get(data_type, {})
+        inferred = pa.Schema.from_pandas(df, preserve_index=False)
+        
+        fields = []
+        for field in inferred:
+            declared = column_dtypes.get(field.name)
+            kind = kinds.get(field.name)
+            if declared == 'category' or kind == 'str':
+                type_ = pa.string()
+            elif declared is not None and np.dtype(declared).kind in 'iu':
+                type_ = pa.int64()
+            elif declared is not None:
+                type_ = pa.from_numpy_dtype(np.dtype(declared))
+            elif (
+                kind == 'numeric'
+                or pa.types.is_integer(field.type)
+                or pa.types.is_floating(field.type)
+            ):
+                type_ = pa.float64()
+            elif (
+                pa.types.is_null(field.type)
+                or pa.types.is_string(field.type)
+                or pa.types.is_large_string(field.type)
+                or pa.types.is_dictionary(field.type)
+            ):
+                type_ = pa.string()
+            else:
+                type_ = field.type
+            fields.append(pa.field(field.name, type_))
+        return pa.schema(fields)
+    
+    @staticmethod
+    def _parquet_options() -> Dict[str, Any]:
+        """Get parquet writer options from OUTPUT_CONFIG.
+        
+        Returns:
+            Keyword arguments for the pyarrow parquet writer.
+        """
+        return {
+            'compression': OUTPUT_CONFIG['compression']['parquet'],
+            'compression_level': OUTPUT_CONFIG['compression_level']['parquet'],
+        }
+    
+    def _write_metadata(self, metadata: Dict[str, Any], output_path: Path) -> None:
+        """Write metadata to a JSON sidecar next to the output file.
+        
+        Args:
+            metadata: Metadata dictionary to serialize.
+            output_path: Path of the data file the metadata belongs to.
+        """
+        metadata_path = output_path.parent / (
+            f"{output_path.stem}{OUTPUT_CONFIG['metadata_file_suffix']}"
+        )
+        
+        # orjson serializes numpy values natively and returns bytes directly
+        if orjson is not None:
+            payload = orjson.dumps(
+                metadata,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            )
+            metadata_path.write_bytes(payload)
+            self.logger.info("Wrote metadata to %s", metadata_path)
+            return
+        
+        # json only calls _json_default for values it cannot serialize
+        # itself, so the metadata is not walked beforehand. The payload is
+        # built first so the sidecar is written in a single call
+        payload = json.dumps(metadata, indent=2, default=_json_default)
+        metadata_path.write_bytes(payload.encode(OUTPUT_CONFIG['encoding']))
+        self.logger.info("Wrote metadata to %s", metadata_path)
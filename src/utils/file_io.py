@@ -1,13 +1,118 @@
 """File I/O utilities for GeoData-Standardizer."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Union, Any, Dict
+from typing import Union, Any, Callable, Dict, Iterable, List, Optional
+import errno
+import fnmatch
 import logging
 import json
+import math
+import mmap
+import os
+import re
+import shutil
+import threading
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
+# Text files at least this large are decoded from a memory map
+_MMAP_MIN_SIZE = 1024 * 1024
+
+# Open flag that stops reads from updating the access time (Linux only)
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+# Directories already created by this module, so repeated writes into the
+# same directory skip the mkdir() syscalls
+_ensured_dirs = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def clear_dir_cache() -> None:
+    """Forget which directories have already been created."""
+    with _ensured_dirs_lock:
+        _ensured_dirs.clear()
+
+
+def _make_dirs(dir_path: Path) -> None:
+    """Create a directory and its parents unless already done.
+    
+    Args:
+        dir_path: Directory to create.
+    """
+    if dir_path in _ensured_dirs:
+        return
+    dir_path.mkdir(parents=True, exist_ok=True)
+    with _ensured_dirs_lock:
+        _ensured_dirs.add(dir_path)
+
+
+def _open_for_read(file_path: Path):
+    """Open a file for binary reading without updating its access time.
+    
+    On Linux O_NOATIME skips the inode atime write a read would otherwise
+    cause. The kernel only allows it for the file's owner, so the file is
+    reopened without it if that is refused.
+    
+    Args:
+        file_path: Path to the file.
+    
+    Returns:
+        Binary file object.
+    """
+    flags = os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(file_path, flags | _O_NOATIME)
+    except PermissionError as e:
+        if not _O_NOATIME or e.errno != errno.EPERM:
+            raise
+        fd = os.open(file_path, flags)
+    try:
+        return os.fdopen(fd, 'rb')
+    except OSError as e:
+        # e.g. IsADirectoryError: os.open() accepts directories
+        os.close(fd)
+        e.filename = str(file_path)
+        raise
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+def _open_for_write(file_path: Path, mode: str, create_dirs: bool, **kwargs):
+    """Open a file for writing, creating its parent directory if requested.
+    
+    Args:
+        file_path: Path to the file.
+        mode: File open mode.
+        create_dirs: Whether to create parent directories.
+        **kwargs: Passed on to open().
+    
+    Returns:
+        Open file object.
+    """
+    parent = file_path.parent
+    if create_dirs:
+        _make_dirs(parent)
+    try:
+        return open(file_path, mode, **kwargs)
+    except FileNotFoundError:
+        if not create_dirs:
+            raise
+        # The directory was removed after it was cached; create it again
+        with _ensured_dirs_lock:
+            _ensured_dirs.discard(parent)
+        _make_dirs(parent)
+        return open(file_path, mode, **kwargs)
+
 
 def read_text_file(file_path: Union[str, Path], encoding: str = 'utf-8') -> str:
     """Read text file and return contents.
@@ -23,18 +128,28 @@ def read_text_file(file_path: Union[str, Path], encoding: str = 'utf-8') -> str:
         FileNotFoundError: If file doesn't exist.
         IOError: If file cannot be read.
     """
-    file_path = Path(file_path)
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
     
     try:
-        with open(file_path, 'r', encoding=encoding) as f:
-            content = f.read()
-        logger.debug(f"Read {len(content)} bytes from {file_path}")
+        with _open_for_read(file_path) as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+                # Decode straight from the page cache, without first copying
+                # the file into a bytes buffer
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = str(mm, encoding)
+            else:
+                content = f.read().decode(encoding)
+        # Match text mode's universal newline handling
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        logger.debug("Read %d bytes from %s", len(content), file_path)
         return content
     except FileNotFoundError:
-        logger.error(f"File not found: {file_path}")
+        logger.error("File not found: %s", file_path)
         raise
     except Exception as e:
-        logger.error(f"Error reading file {file_path}: {e}")
+        logger.error("Error reading file %s: %s", file_path, e)
         raise IOError(f"Failed to read file: {e}")
 
 
@@ -55,20 +170,96 @@ def write_text_file(
     Raises:
         IOError: If file cannot be written.
     """
-    file_path = Path(file_path)
-    
-    if create_dirs:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
     
     try:
-        with open(file_path, 'w', encoding=encoding) as f:
+        with _open_for_write(file_path, 'w', create_dirs, encoding=encoding) as f:
             f.write(content)
-        logger.debug(f"Wrote {len(content)} bytes to {file_path}")
+        logger.debug("Wrote %d bytes to %s", len(content), file_path)
     except Exception as e:
-        logger.error(f"Error writing to file {file_path}: {e}")
+        logger.error("Error writing to file %s: %s", file_path, e)
         raise IOError(f"Failed to write file: {e}")
 
 
+def copy_text_file(
+    src_path: Union[str, Path],
+    dst_path: Union[str, Path],
+    create_dirs: bool = True
+) -> int:
+    """Copy a text file without decoding and re-encoding it.
+    
+    The bytes are copied verbatim, so unlike read_text_file() followed by
+    write_text_file() no newline or encoding translation takes place.
+    shutil.copyfile() moves the data in-kernel (sendfile on Linux).
+    
+    Args:
+        src_path: Path to the source file.
+        dst_path: Path to the destination file.
+        create_dirs: Whether to create parent directories.
+    
+    Returns:
+        Number of bytes copied.
+    
+    Raises:
+        FileNotFoundError: If the source file (or, with create_dirs=False,
+            the destination directory) doesn't exist.
+        IOError: If the file cannot be copied.
+    """
+    if not isinstance(src_path, Path):
+        src_path = Path(src_path)
+    if not isinstance(dst_path, Path):
+        dst_path = Path(dst_path)
+    
+    try:
+        if create_dirs:
+            _make_dirs(dst_path.parent)
+        try:
+            shutil.copyfile(src_path, dst_path)
+        except FileNotFoundError:
+            if not create_dirs or not src_path.exists():
+                raise
+            # The directory was removed after it was cached; create it again
+            with _ensured_dirs_lock:
+                _ensured_dirs.discard(dst_path.parent)
+            _make_dirs(dst_path.parent)
+            shutil.copyfile(src_path, dst_path)
+        size = os.stat(dst_path).st_size
+        logger.debug("Copied %d bytes from %s to %s", size, src_path, dst_path)
+        return size
+    except FileNotFoundError as e:
+        logger.error("File not found: %s", e.filename or src_path)
+        raise
+    except Exception as e:
+        logger.error("Error copying %s to %s: %s", src_path, dst_path, e)
+        raise IOError(f"Failed to copy file: {e}")
+
+
+def _loads_json(buffer: Union[bytes, memoryview]) -> Any:
+    """Parse UTF-8 encoded JSON.
+    
+    orjson parses the bytes directly; the json module needs them decoded to
+    a str first. Documents orjson rejects are retried with the json module,
+    which also accepts the NaN/Infinity literals that write_json_file()
+    emits for non-finite floats.
+    
+    Args:
+        buffer: UTF-8 encoded JSON document.
+    
+    Returns:
+        Parsed JSON data.
+    
+    Raises:
+        json.JSONDecodeError: If the document is invalid.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(buffer)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(str(buffer, 'utf-8'))
+
+
 def read_json_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     """Read JSON file and return parsed data.
     
@@ -80,21 +271,83 @@ def read_json_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     
     Raises:
         FileNotFoundError: If file doesn't exist.
-        ValueError: If file contains invalid JSON.
+        ValueError: If file contains invalid JSON (a json.JSONDecodeError,
+            which carries the position of the error).
     """
-    file_path = Path(file_path)
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        logger.debug(f"Read JSON from {file_path}")
+        with _open_for_read(file_path) as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+                # Parse from the page cache without copying the file first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        data = _loads_json(view)
+            else:
+                data = _loads_json(f.read())
+        logger.debug("Read JSON from %s", file_path)
         return data
     except FileNotFoundError:
-        logger.error(f"JSON file not found: {file_path}")
+        logger.error("JSON file not found: %s", file_path)
         raise
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in file {file_path}: {e}")
-        raise ValueError(f"Invalid JSON: {e}")
+        # Also catches orjson.JSONDecodeError (a subclass). Both are
+        # ValueErrors already, so re-raise the original as is.
+        logger.error("Invalid JSON in file %s: %s", file_path, e)
+        raise
+
+
+def read_json_files(
+    file_paths: Iterable[Union[str, Path]],
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Read several JSON files concurrently.
+    
+    Files are read on a thread pool, so opening and reading one file
+    overlaps with parsing another. The parse itself holds the GIL (for
+    orjson as well, since it builds Python objects), so the gain comes from
+    the I/O rather than from parsing on several cores.
+    
+    Args:
+        file_paths: Paths to the JSON files.
+        max_workers: Maximum number of threads (default: the
+            ThreadPoolExecutor default).
+    
+    Returns:
+        Parsed JSON data for each file, in the order given.
+    
+    Raises:
+        FileNotFoundError: If a file doesn't exist.
+        ValueError: If a file contains invalid JSON.
+    """
+    file_paths = list(file_paths)
+    if len(file_paths) < 2 or max_workers == 1:
+        return [read_json_file(path) for path in file_paths]
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_json_file, file_paths))
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data contains a NaN or infinite float.
+    
+    orjson writes these as null, while the json module writes NaN/Infinity,
+    which read_json_file() parses back into floats.
+    
+    Args:
+        data: Data to check.
+    
+    Returns:
+        True if any float in data, at any depth, is not finite.
+    """
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(item) for item in data)
+    return False
 
 
 def write_json_file(
@@ -114,17 +367,31 @@ def write_json_file(
     Raises:
         IOError: If file cannot be written.
     """
-    file_path = Path(file_path)
-    
-    if create_dirs:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent)
-        logger.debug(f"Wrote JSON to {file_path}")
+        # Serialize before opening, so a failure leaves the target untouched.
+        # orjson only supports compact output or a 2-space indent, and would
+        # write NaN/inf as null, so those payloads go through the json module
+        if (
+            orjson is not None
+            and indent in (None, 2)
+            and not _has_non_finite(data)
+        ):
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            payload = orjson.dumps(data, option=option)
+        else:
+            # Serialize once and write the whole buffer, rather than
+            # json.dump()'s one write() per token
+            payload = json.dumps(data, indent=indent).encode('utf-8')
+        with _open_for_write(file_path, 'wb', create_dirs) as f:
+            f.write(payload)
+        logger.debug("Wrote JSON to %s", file_path)
     except Exception as e:
-        logger.error(f"Error writing JSON to file {file_path}: {e}")
+        logger.error("Error writing JSON to file %s: %s", file_path, e)
         raise IOError(f"Failed to write JSON file: {e}")
 
 
@@ -137,9 +404,13 @@ def ensure_directory_exists(dir_path: Union[str, Path]) -> Path:
     Returns:
         Path object for the directory.
     """
-    dir_path = Path(dir_path)
+    if not isinstance(dir_path, Path):
+        dir_path = Path(dir_path)
+    # Always check the disk here, but remember the result for later writes
     dir_path.mkdir(parents=True, exist_ok=True)
-    logger.debug(f"Ensured directory exists: {dir_path}")
+    with _ensured_dirs_lock:
+        _ensured_dirs.add(dir_path)
+    logger.debug("Ensured directory exists: %s", dir_path)
     return dir_path
 
 
@@ -155,16 +426,116 @@ def get_file_size(file_path: Union[str, Path]) -> int:
     Raises:
         FileNotFoundError: If file doesn't exist.
     """
-    file_path = Path(file_path)
+    if not isinstance(file_path, Path):
+        file_path = Path(file_path)
     
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-    
-    size = file_path.stat().st_size
-    logger.debug(f"File size of {file_path}: {size} bytes")
+    # A single stat(); a missing file surfaces as FileNotFoundError directly
+    try:
+        size = os.stat(file_path).st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+    logger.debug("File size of %s: %d bytes", file_path, size)
     return size
 
 
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> Callable[[str], Any]:
+    """Compile a glob pattern into a file name matcher.
+    
+    Args:
+        pattern: Glob pattern for a single path component.
+    
+    Returns:
+        Match function of the compiled regular expression.
+    """
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _scan_dir(
+    dir_path: Union[str, Path],
+    match: Optional[Callable[[str], Any]],
+    files: list
+) -> list:
+    """Collect matching files from one directory level.
+    
+    Args:
+        dir_path: Directory to scan.
+        match: File name matcher, or None to match every file.
+        files: List that matching file paths are appended to.
+    
+    Returns:
+        Paths of the subdirectories (symlinked directories excluded).
+    """
+    subdirs = []
+    try:
+        it = os.scandir(dir_path)
+    except (NotADirectoryError, PermissionError):
+        return subdirs
+    with it:
+        for entry in it:
+            if entry.is_file():
+                if match is None or match(entry.name):
+                    files.append(Path(entry.path))
+            elif entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+    return subdirs
+
+
+def _scan_tree(
+    dir_path: Union[str, Path],
+    match: Optional[Callable[[str], Any]]
+) -> list:
+    """Collect matching files from a whole directory tree.
+    
+    Args:
+        dir_path: Root of the tree.
+        match: File name matcher, or None to match every file.
+    
+    Returns:
+        List of Path objects for matching files.
+    """
+    files = []
+    pending = [dir_path]
+    while pending:
+        pending.extend(_scan_dir(pending.pop(), match, files))
+    return files
+
+
+def _scan_files(
+    dir_path: Path,
+    match: Optional[Callable[[str], Any]],
+    recursive: bool
+) -> list:
+    """Collect regular files under a directory with os.scandir.
+    
+    For recursive scans each top-level subdirectory is walked on its own
+    thread; os.scandir releases the GIL while it waits on the filesystem.
+    
+    Args:
+        dir_path: Directory to scan.
+        match: File name matcher, or None to match every file.
+        recursive: Whether to descend into subdirectories (symlinked
+            directories are not followed, as with Path.rglob).
+    
+    Returns:
+        List of Path objects for matching files.
+    """
+    files = []
+    subdirs = _scan_dir(dir_path, match, files)
+    if not recursive or not subdirs:
+        return files
+    
+    if len(subdirs) == 1:
+        files.extend(_scan_tree(subdirs[0], match))
+        return files
+    
+    max_workers = min(32, len(subdirs), (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for subtree in executor.map(_scan_tree, subdirs, repeat(match)):
+            files.extend(subtree)
+    return files
+
+
 def list_files_in_directory(
     dir_path: Union[str, Path],
     pattern: str = '*',
@@ -183,18 +554,25 @@ def list_files_in_directory(
     Raises:
         FileNotFoundError: If directory doesn't exist.
     """
-    dir_path = Path(dir_path)
+    if not isinstance(dir_path, Path):
+        dir_path = Path(dir_path)
     
     if not dir_path.exists():
         raise FileNotFoundError(f"Directory not found: {dir_path}")
     
-    if recursive:
-        files = list(dir_path.rglob(pattern))
+    if '/' not in pattern and '**' not in pattern:
+        # Single-component pattern: match names from scandir, whose cached
+        # entry types avoid a stat() per match
+        match = None if pattern == '*' else _compile_pattern(pattern)
+        files = _scan_files(dir_path, match, recursive)
     else:
-        files = list(dir_path.glob(pattern))
-    
-    # Filter to only files (not directories)
-    files = [f for f in files if f.is_file()]
+        if recursive:
+            files = list(dir_path.rglob(pattern))
+        else:
+            files = list(dir_path.glob(pattern))
+        
+        # Filter to only files (not directories)
+        files = [f for f in files if f.is_file()]
     
-    logger.debug(f"Found {len(files)} files in {dir_path} matching '{pattern}'")
+    logger.debug("Found %d files in %s matching '%s'", len(files), dir_path, pattern)
     return files
@@ -1,24 +1,159 @@
 """Logging utilities for GeoData-Standardizer."""
 
+import atexit
 import logging
 import logging.config
+import logging.handlers
+import io
+import queue
+import sys
+import threading
+import traceback
+import types
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+
+# Running queue listeners, keyed by logger name
+_queue_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that buffers records instead of flushing each one.
+    
+    logging.FileHandler flushes the stream after every record, i.e. one
+    write() syscall per log line. This handler lets a larger stream buffer
+    batch the writes. Records at or above ``flush_level`` are still flushed
+    immediately, anything else reaches the file within ``flush_interval``
+    seconds, and the buffer is written out on flush() and close() (which
+    logging.shutdown() calls at exit).
+    
+    Args:
+        filename: Path of the log file.
+        mode: File open mode.
+        encoding: File encoding.
+        buffer_size: Size of the stream buffer in bytes.
+        flush_level: Records at this level or above are flushed at once.
+        flush_interval: Maximum seconds a buffered record waits before it
+            is flushed. None disables the timed flush.
+    """
+    
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        mode: str = 'a',
+        encoding: Optional[str] = None,
+        buffer_size: int = 64 * 1024,
+        flush_level: int = logging.WARNING,
+        flush_interval: Optional[float] = 1.0
+    ):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._flush_timer: Optional[threading.Timer] = None
+        super().__init__(filename, mode=mode, encoding=encoding)
+    
+    def _open(self):
+        """Open the log file with the configured buffer size."""
+        return open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record to the buffer, flushing only important ones."""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+            elif self.flush_interval is not None and self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.flush_interval, self._timed_flush
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _timed_flush(self) -> None:
+        """Flush records buffered since the timer was started."""
+        with self.lock:
+            self._flush_timer = None
+        self.flush()
+    
+    def close(self) -> None:
+        """Cancel a pending timed flush, then flush and close the file."""
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        super().close()
+
+
+def _find_caller(
+    self: logging.Logger,
+    stack_info: bool = False,
+    stacklevel: int = 1
+) -> Tuple[str, int, str, Optional[str]]:
+    """Locate the caller of a logging call without a full frame walk.
+    
+    Drop-in replacement for Logger.findCaller(). It starts three frames up
+    (this function, Logger._log and the debug()/info()/... method) and only
+    then skips any remaining logging-internal frames, e.g. from exception()
+    or LoggerAdapter.
+    
+    Args:
+        self: Logger the call was made on.
+        stack_info: Whether to include the formatted stack.
+        stacklevel: Number of caller frames to go up (1 = direct caller).
+    
+    Returns:
+        Tuple of (filename, line number, function name, stack info).
+    """
+    try:
+        frame = sys._getframe(3)
+    except ValueError:
+        frame = None
+    while frame is not None and frame.f_code.co_filename == logging._srcfile:
+        frame = frame.f_back
+    for _ in range(stacklevel - 1):
+        if frame is None or frame.f_back is None:
+            break
+        frame = frame.f_back
+    if frame is None:
+        return '(unknown file)', 0, '(unknown function)', None
+    
+    sinfo = None
+    if stack_info:
+        with io.StringIO() as sio:
+            sio.write('Stack (most recent call last):\n')
+            traceback.print_stack(frame, file=sio)
+            sinfo = sio.getvalue().rstrip('\n')
+    code = frame.f_code
+    return code.co_filename, frame.f_lineno, code.co_name, sinfo
 
 
 def setup_logger(
     name: str = None,
     log_file: Optional[Path] = None,
     level: int = logging.INFO,
-    console: bool = True
+    console: bool = True,
+    use_queue: bool = True
 ) -> logging.Logger:
     """Set up logger with console and file handlers.
     
     Args:
         name: Logger name. If None, returns root logger.
-        log_file: Optional path to log file.
+        log_file: Optional path to log file (written through a
+            BufferedFileHandler).
         level: Logging level.
         console: Whether to add console handler.
+        use_queue: If True, the handlers run on a background QueueListener
+            thread (see enable_queue_logging()).
     
     Returns:
         Configured logger instance.
@@ -31,6 +166,7 @@ def setup_logger(
     logger.setLevel(level)
     
     # Remove existing handlers to avoid duplicates
+    stop_queue_logging(logger)
     logger.handlers.clear()
     
     # Create formatter
@@ -51,25 +187,32 @@ def setup_logger(
         # Ensure log directory exists
         log_file.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file)
+        file_handler = BufferedFileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
+    if use_queue and logger.handlers:
+        enable_queue_logging(logger)
+    
     return logger
 
 
 def setup_detailed_logger(
     name: str = None,
     log_file: Optional[Path] = None,
-    level: int = logging.INFO
+    level: int = logging.INFO,
+    use_queue: bool = True
 ) -> logging.Logger:
     """Set up logger with detailed formatting including file and line number.
     
     Args:
         name: Logger name. If None, returns root logger.
-        log_file: Optional path to log file.
+        log_file: Optional path to log file (written through a
+            BufferedFileHandler).
         level: Logging level.
+        use_queue: If True, the handlers run on a background QueueListener
+            thread (see enable_queue_logging()).
     
     Returns:
         Configured logger instance with detailed formatting.
@@ -81,7 +224,12 @@ def setup_detailed_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
+    # The detailed format needs the caller's file, line and function for
+    # every record; look them up directly
+    logger.findCaller = types.MethodType(_find_caller, logger)
+    
     # Remove existing handlers
+    stop_queue_logging(logger)
     logger.handlers.clear()
     
     # Create detailed formatter
@@ -100,11 +248,14 @@ def setup_detailed_logger(
     # File handler
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = BufferedFileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
+    if use_queue and logger.handlers:
+        enable_queue_logging(logger)
+    
     return logger
 
 
@@ -124,9 +275,30 @@ def get_logger(name: str = None) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def get_handlers(logger: logging.Logger) -> List[logging.Handler]:
+    """Get the handlers that actually write a logger's records.
+    
+    For a logger serviced by enable_queue_logging() these are the queue
+    listener's handlers rather than the QueueHandler in logger.handlers.
+    
+    Args:
+        logger: Logger instance.
+    
+    Returns:
+        List of handlers.
+    """
+    listener = _queue_listeners.get(logger.name)
+    if listener is not None:
+        return list(listener.handlers)
+    return list(logger.handlers)
+
+
 def set_log_level(logger: logging.Logger, level: int) -> None:
     """Set the log level for a logger and all its handlers.
     
+    If the logger's handlers run on a queue listener (see
+    enable_queue_logging()), the listener's handlers are updated as well.
+    
     Args:
         logger: Logger instance.
         level: New logging level.
@@ -136,7 +308,7 @@ def set_log_level(logger: logging.Logger, level: int) -> None:
         >>> set_log_level(logger, logging.DEBUG)
     """
     logger.setLevel(level)
-    for handler in logger.handlers:
+    for handler in {*logger.handlers, *get_handlers(logger)}:
         handler.setLevel(level)
 
 
@@ -162,3 +334,73 @@ def enable_logging() -> None:
         >>> enable_logging()
     """
     logging.disable(logging.NOTSET)
+
+
+def enable_queue_logging(logger: logging.Logger) -> logging.handlers.QueueListener:
+    """Move a logger's handlers onto a background thread.
+    
+    The logger's current handlers are attached to a QueueListener and
+    replaced with a single QueueHandler, so logging calls only enqueue the
+    record and never block on console or file writes. A logger that is
+    already queued is left as is and its running listener returned; if its
+    handlers were changed since, the old listener is stopped and its
+    handlers are moved to a new one.
+    
+    Args:
+        logger: Logger whose handlers should be serviced by the queue.
+    
+    Returns:
+        The started QueueListener.
+    
+    Example:
+        >>> logger = setup_logger('my_app', log_file=Path('app.log'),
+        ...                       use_queue=False)
+        >>> enable_queue_logging(logger)
+    """
+    listener = _queue_listeners.get(logger.name)
+    if listener is not None and all(
+        isinstance(h, logging.handlers.QueueHandler) and h.queue is listener.queue
+        for h in logger.handlers
+    ):
+        return listener
+    
+    # Wrap the handlers that actually write, not a previous QueueHandler
+    handlers = get_handlers(logger)
+    stop_queue_logging(logger)
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    
+    _queue_listeners[logger.name] = listener
+    return listener
+
+
+def stop_queue_logging(logger: Optional[logging.Logger] = None) -> None:
+    """Stop queue listeners, writing out any records still queued.
+    
+    The listener's handlers are put back on the logger, so records logged
+    afterwards are written directly instead of piling up in the queue.
+    
+    Args:
+        logger: Logger whose listener to stop. If None, stops all listeners.
+    
+    Example:
+        >>> stop_queue_logging()
+    """
+    if logger is None:
+        names = list(_queue_listeners)
+    else:
+        names = [logger.name] if logger.name in _queue_listeners else []
+    
+    for name in names:
+        listener = _queue_listeners.pop(name)
+        listener.stop()
+        logging.getLogger(name).handlers = list(listener.handlers)
+
+
+# Drain queued records before logging.shutdown() closes the handlers
+atexit.register(stop_queue_logging)
@@ -1,6 +1,7 @@
 """Tests for base_parser module."""
 
 import pytest
+import pandas as pd
 from pathlib import Path
 from src.core.base_parser import BaseParser, ParserError
 
@@ -29,3 +30,189 @@ def test_parser_error_exception():
     error = ParserError("Test error message")
     assert str(error) == "Test error message"
     assert isinstance(error, Exception)
+
+
+def test_parse_iter_streams_standardized_chunks(tmp_path):
+    """Test that parse_iter yields standardized chunks covering the file."""
+    from src.parsers.radar_parser import RadarParser
+    
+    data_file = tmp_path / 'radar.csv'
+    rows = ''.join(f"{i // 10},{i % 10},{i}\n" for i in range(50))
+    data_file.write_text('trace,sample,amp\n' + rows)
+    
+    parser = RadarParser(data_file)
+    chunks = list(parser.parse_iter(chunk_size=20))
+    
+    assert sum(len(chunk) for chunk in chunks) == 50
+    assert list(chunks[0].columns) == ['trace_number', 'sample_number', 'amplitude']
+    assert parser.metadata['record_count'] == 50
+
+
+def test_large_file_is_parsed_from_memory_map(tmp_path, monkeypatch):
+    """Test that files above the mmap threshold parse without reading raw text."""
+    from src.config import APP_CONFIG
+    from src.parsers.radar_parser import RadarParser
+    
+    monkeypatch.setitem(APP_CONFIG, 'mmap_threshold_mb', 0)
+    data_file = tmp_path / 'radar.csv'
+    data_file.write_text('trace,sample,amp\n1,0,5\n1,1,7\n')
+    
+    parser = RadarParser(data_file)
+    parser.load()
+    assert parser._raw_data is None
+    
+    result = parser.parse()
+    assert result['data']['amplitude'].tolist() == [5, 7]
+    assert parser.raw_data.startswith('trace,sample,amp')
+
+
+def test_validate_rejects_non_numeric_required_columns(tmp_path):
+    """Test that validate reports required columns with a non-numeric dtype."""
+    from src.core.base_parser import ValidationError
+    from src.parsers.seismic_parser import SeismicParser
+    
+    data_file = tmp_path / 'seismic.csv'
+    data_file.write_text('trace,time,amp\n1,0,high\n1,1,low\n')
+    
+    parser = SeismicParser(data_file)
+    parser.process(skip_validation=True)
+    with pytest.raises(ValidationError, match='amplitude'):
+        parser.validate()
+
+
+def test_validate_reports_all_out_of_range_columns(tmp_path):
+    """Test that one ValidationError lists every out-of-range column."""
+    from src.core.base_parser import ValidationError
+    from src.parsers.radar_parser import RadarParser
+    
+    data_file = tmp_path / 'radar.csv'
+    data_file.write_text('trace,sample,amp\n1,-1,5\n1,1,99999\n')
+    
+    parser = RadarParser(data_file)
+    parser.process(skip_validation=True)
+    with pytest.raises(ValidationError) as excinfo:
+        parser.validate()
+    assert 'sample_number' in str(excinfo.value)
+    assert 'amplitude' in str(excinfo.value)
+
+
+def test_elec_chunked_parse_matches_full_parse(tmp_path):
+    """Test that a chunked ElecParser parse gives the same data and metadata."""
+    from src.parsers.elec_parser import ElecParser
+    
+    data_file = tmp_path / 'elec.csv'
+    rows = ''.join(f"S{i % 7},{i * 0.5},{i + 1}\n" for i in range(100))
+    data_file.write_text('station,depth,resistivity\n' + rows)
+    
+    full = ElecParser(data_file).process(skip_validation=True)
+    chunked = ElecParser(data_file, chunksize=30).process(skip_validation=True)
+    
+    assert chunked['data'].equals(full['data'])
+    for key in ('record_count', 'stations', 'depth_range_m', 'resistivity_range_ohm_m'):
+        assert chunked['metadata'][key] == full['metadata'][key]
+
+
+def test_column_names_match_case_insensitively(tmp_path):
+    """Test that column mapping ignores case and surrounding whitespace."""
+    from src.parsers.elec_parser import ElecParser
+    
+    data_file = tmp_path / 'elec.csv'
+    data_file.write_text('STATION , Depth,resistivity\nS1,1.0,10\n')
+    
+    result = ElecParser(data_file).process()
+    assert list(result['data'].columns) == ['station_id', 'depth_m', 'resistivity_ohm_m']
+
+
+def test_elec_parse_applies_column_dtypes(tmp_path):
+    """Test that ElecParser parses with the configured column dtypes."""
+    from src.parsers.elec_parser import ElecParser
+    
+    data_file = tmp_path / 'elec.csv'
+    data_file.write_text('station,depth,resistivity\nS1,1,10\nS1,2,20\n')
+    
+    df = ElecParser(data_file).process()['data']
+    assert isinstance(df['station_id'].dtype, pd.CategoricalDtype)
+    assert df['resistivity_ohm_m'].dtype == ElecParser.column_dtypes['resistivity_ohm_m']
+
+
+def test_clean_matches_dropna_then_drop_duplicates(tmp_path):
+    """Test that the fused _clean matches chaining dropna and drop_duplicates."""
+    from src.parsers.radar_parser import RadarParser
+    
+    data_file = tmp_path / 'radar.csv'
+    data_file.write_text('trace,sample,amp\n1,0,5\n')
+    parser = RadarParser(data_file)
+    
+    df = pd.DataFrame({
+        'a': [1, 1, None, 2, 2, 3],
+        'b': [5, 5, 6, None, 7, 7],
+    })
+    expected = df.dropna().drop_duplicates()
+    
+    pd.testing.assert_frame_equal(parser._clean(df), expected)
+
+
+def test_process_validation_cache_is_opt_in_and_tracks_changes(tmp_path, monkeypatch):
+    """Test that process() only skips validation of an unchanged file when enabled."""
+    from src.config import APP_CONFIG
+    from src.parsers.radar_parser import RadarParser
+    
+    calls = []
+    original = RadarParser.validate
+    monkeypatch.setattr(
+        RadarParser, 'validate',
+        lambda self, data=None: calls.append(self) or original(self, data)
+    )
+    data_file = tmp_path / 'radar.csv'
+    data_file.write_text('trace,sample,amp\n7,0,5\n7,1,9\n')
+    
+    def process_twice():
+        calls.clear()
+        for _ in range(2):
+            parser = RadarParser(data_file)
+            parser.process()
+            assert parser.is_validated
+        return len(calls)
+    
+    # Off by default
+    assert process_twice() == 2
+    
+    monkeypatch.setitem(APP_CONFIG, 'validation_cache_size', 8)
+    assert process_twice() == 1
+    
+    # Rewriting the file, or parsing it with other parameters, validates again
+    data_file.write_text('trace,sample,amp\n7,0,5\n7,1,8\n')
+    assert process_twice() == 1
+    calls.clear()
+    RadarParser(data_file, chunksize=100).process()
+    assert len(calls) == 1
+
+
+def test_integer_dtypes_never_wrap_out_of_range_values(tmp_path):
+    """Test that declared int32 columns keep values that do not fit int32."""
+    from src.parsers.radar_parser import RadarParser
+    
+    data_file = tmp_path / 'radar.csv'
+    data_file.write_text('trace,sample,amp\n1,0,5\n2,3000000000,7\n')
+    
+    parser = RadarParser(data_file)
+    parser.load()
+    df = parser.parse()['data']
+    
+    assert df['trace_number'].dtype == 'int32'
+    assert df['sample_number'].tolist() == [0, 3000000000]
+
+
+def test_parsed_data_is_writable(tmp_path):
+    """Test that frames returned by a full and a chunked parse can be edited."""
+    from src.parsers.elec_parser import ElecParser
+    
+    data_file = tmp_path / 'elec.csv'
+    rows = ''.join(f"S{i % 3},{i + 1.0},{i + 10}\n" for i in range(50))
+    data_file.write_text('station,depth,resistivity\n' + rows)
+    
+    for parser in (ElecParser(data_file), ElecParser(data_file, chunksize=20)):
+        df = parser.process()['data']
+        df.loc[0, 'depth_m'] = 100.0
+        df.loc[1, 'resistivity_ohm_m'] = 30.0
+        assert df['depth_m'].iloc[:2].tolist() == [100.0, 2.0]
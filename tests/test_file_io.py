@@ -0,0 +1,53 @@
+"""Tests for file_io module."""
+
+import math
+
+import pytest
+
+from src.utils.file_io import copy_text_file, read_json_file, write_json_file
+
+
+def test_copy_text_file_copies_bytes_verbatim(tmp_path):
+    """Test that copy_text_file keeps the bytes, newlines included."""
+    source = tmp_path / 'in.csv'
+    source.write_bytes(b'a,b\r\n1,2\r\n')
+    target = tmp_path / 'sub' / 'out.csv'
+    
+    assert copy_text_file(source, target) == 10
+    assert target.read_bytes() == source.read_bytes()
+
+
+def test_copy_text_file_reports_the_missing_path(tmp_path, caplog):
+    """Test that a missing destination directory is not reported as the source."""
+    source = tmp_path / 'in.csv'
+    source.write_text('a\n')
+    target = tmp_path / 'missing' / 'out.csv'
+    
+    with pytest.raises(FileNotFoundError) as excinfo:
+        copy_text_file(source, target, create_dirs=False)
+    assert excinfo.value.filename == str(target)
+    assert str(target) in caplog.text
+    
+    with pytest.raises(FileNotFoundError):
+        copy_text_file(tmp_path / 'nope.csv', target)
+
+
+def test_write_json_file_round_trips_non_finite_floats(tmp_path):
+    """Test that NaN and infinity are written so they read back as floats."""
+    target = tmp_path / 'out.json'
+    
+    write_json_file(target, {'a': float('nan'), 'b': [float('inf'), 1.5]})
+    data = read_json_file(target)
+    
+    assert math.isnan(data['a'])
+    assert data['b'] == [float('inf'), 1.5]
+
+
+def test_write_json_file_keeps_target_on_serialization_error(tmp_path):
+    """Test that data that cannot be serialized leaves the existing file intact."""
+    target = tmp_path / 'out.json'
+    target.write_text('{"a": 1}')
+    
+    with pytest.raises(IOError):
+        write_json_file(target, {'a': {1, 2}})
+    assert target.read_text() == '{"a": 1}'
@@ -0,0 +1,52 @@
+"""Tests for logger module."""
+
+import logging
+
+from src.utils.logger import enable_queue_logging, stop_queue_logging
+
+
+class _ListHandler(logging.Handler):
+    """Handler that keeps the messages it receives."""
+    
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+    
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_queue_logging_enable_twice_then_stop_keeps_every_record():
+    """Test that re-enabling and stopping queue logging never drops records."""
+    logger = logging.getLogger('test_queue_logging')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = _ListHandler()
+    logger.handlers = [handler]
+    
+    enable_queue_logging(logger)
+    logger.info('one')
+    enable_queue_logging(logger)
+    logger.info('two')
+    stop_queue_logging(logger)
+    logger.info('three')
+    
+    assert handler.messages == ['one', 'two', 'three']
+    assert logger.handlers == [handler]
+
+
+def test_enable_queue_logging_is_idempotent():
+    """Test that enabling queue logging on a queued logger keeps its listener."""
+    logger = logging.getLogger('test_queue_logging_idempotent')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = _ListHandler()
+    logger.handlers = [handler]
+    
+    listener = enable_queue_logging(logger)
+    assert enable_queue_logging(logger) is listener
+    logger.info('one')
+    stop_queue_logging(logger)
+    
+    assert handler.messages == ['one']
+    assert logger.handlers == [handler]
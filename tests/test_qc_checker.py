@@ -0,0 +1,51 @@
+"""Tests for qc_checker module."""
+
+import pandas as pd
+from src.processors.qc_checker import QCChecker
+
+
+def _radar_data(amplitudes):
+    """Build parsed radar data with the given amplitude column."""
+    df = pd.DataFrame({
+        'trace_number': [1, 1, 2, 2, 3, 3, 4, 4],
+        'sample_number': [0, 1, 0, 1, 0, 1, 0, 1],
+        'amplitude': amplitudes,
+    })
+    return {'metadata': {}, 'data': df}
+
+
+def test_check_passes_clean_data():
+    """Test that clean data passes all QC checks."""
+    result = QCChecker().check(_radar_data([10, 12, 11, 13, 12, 11, 10, 13]), 'radar')
+    assert result['passed']
+    assert result['issues'] == []
+    assert 'ranges' in result['checks_run']
+
+
+def test_check_flags_out_of_range_values():
+    """Test that values outside PARSER_CONFIG ranges are reported as issues."""
+    result = QCChecker().check(_radar_data([10, 12, 11, 13, 12, 11, 10, 40000]), 'radar')
+    assert not result['passed']
+    assert 'amplitude' in result['issues'][0]
+
+
+def test_check_warns_on_outliers():
+    """Test that IQR outliers are reported as warnings."""
+    result = QCChecker().check(_radar_data([10, 12, 11, 13, 12, 11, 10, 900]))
+    assert result['passed']
+    assert 'ranges' not in result['checks_run']
+    assert any('amplitude' in w for w in result['warnings'])
+
+
+def test_check_reports_schema_validity():
+    """Test that schema_valid reflects required columns and value ranges."""
+    result = QCChecker().check(_radar_data([10, 12, 11, 13, 12, 11, 10, 13]), 'radar')
+    assert result['schema_valid'] is True
+    
+    parsed = _radar_data([10, 12, 11, 13, 12, 11, 10, 13])
+    parsed['data'] = parsed['data'].drop(columns=['amplitude'])
+    result = QCChecker().check(parsed, 'radar')
+    assert result['schema_valid'] is False
+    assert 'amplitude' in result['schema_errors'][0]
+    
+    assert QCChecker().check(parsed)['schema_valid'] is None
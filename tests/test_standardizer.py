@@ -0,0 +1,56 @@
+"""Tests for standardizer module."""
+
+import pandas as pd
+
+from src.parsers.radar_parser import RadarParser
+from src.processors.standardizer import Standardizer
+
+
+def test_write_output_csv_reflects_parsed_frame(tmp_path):
+    """Test that CSV output is written from the frame, not copied from the source."""
+    source = tmp_path / 'radar.csv'
+    source.write_text(
+        'amplitude,sample_number,trace_number\n'
+        + ''.join(f"{i * 3}.50,{i % 10},{i // 10}\n" for i in range(100))
+    )
+    parsed = RadarParser(source).process(skip_validation=True)
+    parsed['data'].loc[99, 'amplitude'] = -1.0
+    
+    standardizer = Standardizer(output_format='csv')
+    result = standardizer.standardize(parsed, 'radar')
+    
+    output = tmp_path / 'out.csv'
+    standardizer.write_output(result, output, include_metadata=False)
+    written = pd.read_csv(output)
+    assert written['amplitude'].iloc[-1] == -1.0
+    assert '3.5,' in output.read_text()
+
+
+def test_write_stream_parquet_accepts_chunks_with_different_dtypes(tmp_path):
+    """Test that later parquet chunks may infer different dtypes than the first."""
+    import numpy as np
+    import pyarrow.parquet as pq
+    
+    chunks = [
+        pd.DataFrame({
+            'trace_number': np.array([1, 2], dtype='int32'),
+            'sample_number': np.array([0, 1], dtype='int32'),
+            'amplitude': [5, 6],
+            'distance_m': [np.nan, np.nan],
+        }),
+        pd.DataFrame({
+            'trace_number': [2**40, 3],
+            'sample_number': [2.0, np.nan],
+            'amplitude': [5.5, 6.0],
+            'distance_m': [1.0, 2.0],
+        }),
+    ]
+    output = tmp_path / 'out.parquet'
+    count = Standardizer(output_format='parquet').write_stream(
+        chunks, 'radar', output, column_dtypes=RadarParser.column_dtypes
+    )
+    
+    table = pq.read_table(output)
+    assert count == table.num_rows == 4
+    assert table['trace_number'].to_pylist() == [1, 2, 2**40, 3]
+    assert table['amplitude'].to_pylist() == [5.0, 6.0, 5.5, 6.0]